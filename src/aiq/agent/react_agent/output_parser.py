@@ -28,6 +28,11 @@ MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "Invalid Format: Missing 'Acti
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = ("Parsing LLM output produced both a final answer and a parse-able "
                                                   "action:")
 
+_ACTION_RE = re.compile(
+    r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)(?=\s*[\n|\s]\s*Observation\b|$)", re.DOTALL)
+# Matches both 'Action:' and 'Action Input:' markers, the group is only set for the latter
+_ACTION_MARKER_RE = re.compile(r"Action\s*\d*\s*(Input\s*\d*\s*)?:")
+
 
 class ReActOutputParserException(ValueError, LangChainException):
 
@@ -74,8 +79,16 @@ class ReActOutputParser(AgentOutputParser):
 
     def parse(self, text: str) -> AgentAction | AgentFinish:
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)(?=\s*[\n|\s]\s*Observation\b|$)"
-        action_match = re.search(regex, text, re.DOTALL)
+
+        # Every action pattern needs a literal 'Action', so without one the regexes cannot match and a plain substring
+        # check is enough. This is the common case of a final answer.
+        if ("Action" not in text):
+            if includes_answer:
+                return AgentFinish({"output": text.rpartition(FINAL_ANSWER_ACTION)[2].strip()}, text)
+            raise ReActOutputParserException(observation=MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE,
+                                             missing_action=True)
+
+        action_match = _ACTION_RE.search(text)
         if action_match:
             if includes_answer:
                 raise ReActOutputParserException(
@@ -89,12 +102,23 @@ class ReActOutputParser(AgentOutputParser):
             return AgentAction(action, tool_input, text)
 
         if includes_answer:
-            return AgentFinish({"output": text.split(FINAL_ANSWER_ACTION)[-1].strip()}, text)
-
-        if not re.search(r"Action\s*\d*\s*:[\s]*(.*?)", text, re.DOTALL):
+            return AgentFinish({"output": text.rpartition(FINAL_ANSWER_ACTION)[2].strip()}, text)
+
+        # Find out which of the markers are missing with a single scan of the text
+        has_action = False
+        has_action_input = False
+        for marker in _ACTION_MARKER_RE.finditer(text):
+            if (marker.group(1) is None):
+                has_action = True
+            else:
+                has_action_input = True
+            if (has_action and has_action_input):
+                break
+
+        if not has_action:
             raise ReActOutputParserException(observation=MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE,
                                              missing_action=True)
-        if not re.search(r"[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", text, re.DOTALL):
+        if not has_action_input:
             raise ReActOutputParserException(observation=MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE,
                                              missing_action_input=True)
         raise ReActOutputParserException(f"Could not parse LLM output: `{text}`")
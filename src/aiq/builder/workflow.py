@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import AbstractAsyncContextManager
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from typing import Any
 
+from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace.export import SpanExporter
 
 from aiq.builder.context import AIQContextState
@@ -45,7 +47,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                  llms: dict[str, LLMProviderInfo] | None = None,
                  embeddings: dict[str, EmbedderProviderInfo] | None = None,
                  memory: dict[str, MemoryEditor] | None = None,
-                 exporters: dict[str, SpanExporter] | None = None,
+                 exporters: dict[str, SpanExporter | SpanProcessor] | None = None,
                  retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                  context_state: AIQContextState):
 
@@ -77,13 +79,17 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         return self._entry_fn.has_single_output
 
     @asynccontextmanager
-    async def run(self, message: InputT):
+    async def run(self, message: InputT, concurrency_limiter: AbstractAsyncContextManager | None = None):
         """
         Called each time we start a new workflow run. We'll create
         a new top-level workflow span here.
         """
-        async with AIQRunner(input_message=message, entry_fn=self._entry_fn,
-                             context_state=self._context_state) as runner:
+        async with AIQRunner(input_message=message,
+                             entry_fn=self._entry_fn,
+                             context_state=self._context_state,
+                             trace_sampling=self.config.general.telemetry.sampling,
+                             enable_tracing=len(self._exporters) > 0,
+                             concurrency_limiter=concurrency_limiter) as runner:
 
             # The caller can `yield runner` so they can do `runner.result()` or `runner.result_stream()`
             yield runner
@@ -112,7 +118,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                       llms: dict[str, LLMProviderInfo] | None = None,
                       embeddings: dict[str, EmbedderProviderInfo] | None = None,
                       memory: dict[str, MemoryEditor] | None = None,
-                      exporters: dict[str, SpanExporter] | None = None,
+                      exporters: dict[str, SpanExporter | SpanProcessor] | None = None,
                       retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                       context_state: AIQContextState) -> 'Workflow[InputT, StreamingOutputT, SingleOutputT]':
 
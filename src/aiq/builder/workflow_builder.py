@@ -23,6 +23,7 @@ from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
 
 from opentelemetry import trace
+from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.trace.export import SpanExporter
@@ -67,7 +68,7 @@ logger = logging.getLogger(__name__)
 @dataclasses.dataclass
 class ConfiguredExporter:
     config: TelemetryExporterBaseConfig
-    instance: SpanExporter
+    instance: SpanExporter | SpanProcessor
 
 
 @dataclasses.dataclass
@@ -165,7 +166,12 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
             instance = await self._exit_stack.enter_async_context(exporter_info.build_fn(trace_exporter_config, self))
 
-            span_processor_instance = BatchSpanProcessor(instance)
+            # Exporters may supply their own, tuned, span processor. Otherwise wrap the exporter in a default one
+            if (isinstance(instance, SpanProcessor)):
+                span_processor_instance = instance
+            else:
+                span_processor_instance = BatchSpanProcessor(instance)
+
             provider.add_span_processor(span_processor_instance)
 
             self._exporters[key] = ConfiguredExporter(config=trace_exporter_config, instance=instance)
@@ -23,6 +23,7 @@ from copy import deepcopy
 from functools import cached_property
 from logging import Handler
 
+from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace.export import SpanExporter
 from pydantic import BaseModel
 from pydantic import ConfigDict
@@ -71,7 +72,8 @@ from aiq.registry_handlers.registry_handler_base import AbstractRegistryHandler
 logger = logging.getLogger(__name__)
 
 FrontEndBuildCallableT = Callable[[FrontEndConfigT, AIQConfig], AsyncIterator[FrontEndBase]]
-TelemetryExporterBuildCallableT = Callable[[TelemetryExporterConfigT, Builder], AsyncIterator[SpanExporter]]
+TelemetryExporterBuildCallableT = Callable[[TelemetryExporterConfigT, Builder],
+                                           AsyncIterator[SpanExporter | SpanProcessor]]
 LoggingMethodBuildCallableT = Callable[[LoggingMethodConfigT, Builder], AsyncIterator[Handler]]
 FunctionBuildCallableT = Callable[[FunctionConfigT, Builder], AsyncIterator[FunctionInfo | Callable | FunctionBase]]
 LLMProviderBuildCallableT = Callable[[LLMBaseConfigT, Builder], AsyncIterator[LLMProviderInfo]]
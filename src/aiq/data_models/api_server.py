@@ -335,6 +335,7 @@ class ErrorTypes(str, Enum):
     INVALID_MESSAGE_TYPE = "invalid_message_type"
     INVALID_USER_MESSAGE_CONTENT = "invalid_user_message_content"
     INVALID_DATA_CONTENT = "invalid_data_content"
+    SERVER_OVERLOADED = "server_overloaded"
 
 
 class Error(BaseModel):
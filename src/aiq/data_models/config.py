@@ -20,6 +20,7 @@ import typing
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
@@ -124,10 +125,36 @@ def _process_validation_error(err: ValidationError, handler: ValidatorFunctionWr
         raise ValidationError.from_exception_data(title=err.title, line_errors=new_errors)
 
 
+class TraceSamplingConfig(BaseModel):
+    """
+    Tail-based sampling of workflow traces. The decision to export a trace is made once the workflow run has finished.
+    Failed runs, and runs slower than `slow_trace_threshold`, are always exported in full. All other runs are exported
+    with probability `sample_ratio`.
+    """
+
+    sample_ratio: float = Field(default=1.0, ge=0.0, le=1.0)
+    """
+    The fraction of successful, fast workflow runs whose traces are exported. The default of 1.0 exports every trace.
+    """
+
+    slow_trace_threshold: float | None = Field(default=None, ge=0.0)
+    """
+    Runs which take longer than this many seconds are always exported. If `None`, run duration is not considered.
+    """
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Whether any traces can be dropped, requiring the sampling decision to wait until the run finishes.
+        """
+        return self.sample_ratio < 1.0
+
+
 class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = {}
     tracing: dict[str, TelemetryExporterBaseConfig] = {}
+    sampling: TraceSamplingConfig = TraceSamplingConfig()
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
@@ -33,13 +33,13 @@ class DatasetHandler:
     """
 
     def __init__(self, dataset_config: EvalDatasetConfig, reps: int):
-        from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
+        from aiq.eval.intermediate_step_adapter import INTERMEDIATE_STEP_ADAPTER
 
         self.dataset_config = dataset_config
         self.dataset_filter = DatasetFilter(dataset_config.filter)
         self.reps = reps
         # Helpers
-        self.intermediate_step_adapter = IntermediateStepAdapter()
+        self.intermediate_step_adapter = INTERMEDIATE_STEP_ADAPTER
 
     def is_structured_input(self) -> bool:
         '''Check if the input is structured or unstructured'''
@@ -19,6 +19,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+from jsonpath_ng import parse
 from pydantic import BaseModel
 from tqdm import tqdm
 
@@ -34,6 +35,17 @@ from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
 
+# Parsed jsonpath expressions keyed by the path string, shared across evaluation runs
+_JSONPATH_CACHE: dict[str, Any] = {}
+
+
+def _get_jsonpath_expr(path_str: str) -> Any:
+    """Return the parsed jsonpath expression for `path_str`, parsing it only on first use."""
+    jsonpath_expr = _JSONPATH_CACHE.get(path_str)
+    if jsonpath_expr is None:
+        jsonpath_expr = _JSONPATH_CACHE.setdefault(path_str, parse(path_str))
+    return jsonpath_expr
+
 
 class EvaluationRun:  # pylint: disable=too-many-public-methods
     """
@@ -44,6 +56,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         """
         Initialize an EvaluationRun with configuration.
         """
+        from aiq.eval.intermediate_step_adapter import INTERMEDIATE_STEP_ADAPTER
         from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
 
         # Run-specific configuration
@@ -51,7 +64,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         self.eval_config: EvalConfig | None = None
 
         # Helpers
-        self.intermediate_step_adapter: IntermediateStepAdapter = IntermediateStepAdapter()
+        self.intermediate_step_adapter: IntermediateStepAdapter = INTERMEDIATE_STEP_ADAPTER
 
         # Metadata
         self.eval_input: EvalInput | None = None
@@ -71,12 +84,10 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         Launch the workflow with the specified questions and extract the output using the jsonpath
         '''
         # import function level dependencies
-        from jsonpath_ng import parse
-
         from aiq.eval.runtime_event_subscriber import pull_intermediate
 
         # Run the workflow
-        jsonpath_expr = parse(self.config.result_json_path)
+        jsonpath_expr = _get_jsonpath_expr(self.config.result_json_path)
         stop_event = asyncio.Event()
 
         async def run_one(item: EvalInputItem):
@@ -173,26 +184,35 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 self.eval_config.general.output.dir.exists():
             shutil.rmtree(self.eval_config.general.output.dir)
 
-    def write_output(self, dataset_handler: DatasetHandler):
-        workflow_output_file = self.eval_config.general.output_dir / "workflow_output.json"
-        workflow_output_file.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _write_file(output_file: Path, content: str):
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    async def write_output(self, dataset_handler: DatasetHandler):
+        output_dir = self.eval_config.general.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write the workflow output to a file (this can be used for re-running the evaluation)
+        # Workflow output file (this can be used for re-running the evaluation)
+        workflow_output_file = output_dir / "workflow_output.json"
         workflow_output = dataset_handler.publish_eval_input(self.eval_input)
-        with open(workflow_output_file, "w", encoding="utf-8") as f:
-            # set indent to 2 for pretty printing
-            f.write(workflow_output)
-        self.workflow_output_file = workflow_output_file
-        logger.info("Workflow output written to %s", workflow_output_file)
+        writes = [(workflow_output_file, workflow_output)]
 
-        # Write the output of each evaluator to a separate json file
+        # The output of each evaluator is written to a separate json file
+        evaluator_output_files = []
         for evaluator_name, eval_output in self.evaluation_results:
-            output_file = self.eval_config.general.output_dir / f"{evaluator_name}_output.json"
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_file = output_dir / f"{evaluator_name}_output.json"
             # create json content using the evaluation results
-            output = eval_output.model_dump_json(indent=2)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(output)
+            writes.append((output_file, eval_output.model_dump_json(indent=2)))
+            evaluator_output_files.append(output_file)
+
+        # Write all the files concurrently on the default thread pool
+        await asyncio.gather(*[asyncio.to_thread(self._write_file, path, content) for path, content in writes])
+
+        self.workflow_output_file = workflow_output_file
+        logger.info("Workflow output written to %s", workflow_output_file)
+
+        for output_file in evaluator_output_files:
             self.evaluator_output_files.append(output_file)
             logger.info("Evaluation results written to %s", output_file)
 
@@ -279,7 +299,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         await self.profile_workflow()
 
         # Write the results to the output directory
-        self.write_output(dataset_handler)
+        await self.write_output(dataset_handler)
 
         # Run custom scripts and upload evaluation outputs to S3
         if self.eval_config.general.output:
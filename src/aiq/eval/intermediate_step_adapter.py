@@ -91,3 +91,7 @@ class IntermediateStepAdapter:
             str(step.data.output) for step in intermediate_steps
             if step.event_type == IntermediateStepType.TOOL_END and step.data and step.data.output
         ]
+
+
+# The adapter is stateless, share one instance instead of allocating a new one per evaluation
+INTERMEDIATE_STEP_ADAPTER = IntermediateStepAdapter()
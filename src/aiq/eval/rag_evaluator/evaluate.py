@@ -40,11 +40,11 @@ class RAGEvaluator:
     @staticmethod
     def eval_input_to_ragas(eval_input: EvalInput) -> EvaluationDataset:
         """Converts EvalInput into a Ragas-compatible EvaluationDataset."""
-        from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
+        from aiq.eval.intermediate_step_adapter import INTERMEDIATE_STEP_ADAPTER
 
         samples = []
 
-        intermediate_step_adapter = IntermediateStepAdapter()
+        intermediate_step_adapter = INTERMEDIATE_STEP_ADAPTER
         for item in eval_input.eval_input_items:
             # Extract required fields from EvalInputItem
             user_input = item.input_obj  # Assumes input_obj is a string (modify if needed)
@@ -58,9 +58,9 @@ class TrajectoryEvaluator:
         num_records = len(eval_input.eval_input_items)
         logger.info("Running trajectory evaluation with %d records", num_records)
         from aiq.data_models.intermediate_step import IntermediateStepType
-        from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
+        from aiq.eval.intermediate_step_adapter import INTERMEDIATE_STEP_ADAPTER
 
-        intermediate_step_adapter = IntermediateStepAdapter()
+        intermediate_step_adapter = INTERMEDIATE_STEP_ADAPTER
         event_filter = [IntermediateStepType.LLM_END, IntermediateStepType.TOOL_END]
 
         async def process_item(item: EvalInputItem) -> tuple[float, dict]:
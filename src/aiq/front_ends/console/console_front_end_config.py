@@ -30,3 +30,7 @@ class ConsoleFrontEndConfig(FrontEndBaseConfig, name="console"):
                                           description="A single input to submit the the workflow.")
     input_file: Path | None = Field(default=None,
                                     description="Path to a json file of inputs to submit to the workflow.")
+    max_concurrency: int = Field(default=8,
+                                 ge=0,
+                                 description="The maximum number of inputs to run through the workflow concurrently. "
+                                 "Set to 0 for no limit.")
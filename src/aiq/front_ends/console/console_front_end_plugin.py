@@ -14,8 +14,8 @@
 # limitations under the License.
 
 import asyncio
+import itertools
 import logging
-from io import StringIO
 
 import click
 
@@ -58,17 +58,11 @@ class ConsoleFrontEndPlugin(SimpleFrontEndPluginBase[ConsoleFrontEndConfig]):
         # Must yield the workflow function otherwise it cleans up
         async with WorkflowBuilder.from_config(config=self.full_config) as builder:
 
-            session_manager: AIQSessionManager = None
-
             if logger.isEnabledFor(logging.INFO):
-                stream = StringIO()
-
-                self.full_config.print_summary(stream=stream)
+                self.full_config.print_summary(stream=click.get_text_stream("stdout"))
 
-                click.echo(stream.getvalue())
-
-                workflow = builder.build()
-                session_manager = AIQSessionManager(workflow)
+            workflow = builder.build()
+            session_manager = AIQSessionManager(workflow, max_concurrency=self.front_end_config.max_concurrency)
 
             await self.run_workflow(session_manager)
 
@@ -78,26 +72,62 @@ class ConsoleFrontEndPlugin(SimpleFrontEndPluginBase[ConsoleFrontEndConfig]):
 
         if (self.front_end_config.input_query):
 
-            async def run_single_query(query):
+            async def run_single_query(index: int, query: str) -> tuple[int, str]:
 
                 async with session_manager.session(user_input_callback=prompt_for_input_cli) as session:
                     async with session.run(query) as runner:
                         base_output = await runner.result(to_type=str)
 
-                        return base_output
+                        return index, base_output
 
             # Convert to a list
             input_list = list(self.front_end_config.input_query)
             logger.info("Processing input: %s", self.front_end_config.input_query)
 
-            runner_outputs = await asyncio.gather(*[run_single_query(query) for query in input_list])
+            # Only keep as many runs in flight as the session manager allows to run concurrently, starting the next
+            # input as each one completes. Results are reported as soon as they are available, while the final summary
+            # keeps the input order.
+            runner_outputs = [None] * len(input_list)
+
+            max_in_flight = self.front_end_config.max_concurrency or len(input_list)
+            queued_inputs = enumerate(input_list)
+
+            def start_next(count: int) -> set[asyncio.Task]:
+                return {
+                    asyncio.create_task(run_single_query(index, query))
+                    for index, query in itertools.islice(queued_inputs, count)
+                }
+
+            pending = start_next(max_in_flight)
+
+            try:
+                while (pending):
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                    for task in done:
+                        index, base_output = task.result()
+
+                        if (len(input_list) > 1):
+                            logger.info("Completed input %d of %d:\n%s", index + 1, len(input_list), base_output)
+
+                        runner_outputs[index] = base_output
+
+                    pending |= start_next(len(done))
+            finally:
+                # Stop the remaining runs if one of them failed, and wait for them to finish cancelling
+                for task in pending:
+                    task.cancel()
+
+                await asyncio.gather(*pending, return_exceptions=True)
 
         elif (self.front_end_config.input_file):
 
-            # Run the workflow
-            with open(self.front_end_config.input_file, "r", encoding="utf-8") as f:
+            # Read the file on a worker thread so the event loop is not blocked by disk I/O
+            file_input = await asyncio.to_thread(self.front_end_config.input_file.read_text, encoding="utf-8")
 
-                async with session_manager.workflow.run(f) as runner:
+            # Run the workflow
+            async with session_manager.session(user_input_callback=prompt_for_input_cli) as session:
+                async with session.run(file_input) as runner:
                     runner_outputs = await runner.result(to_type=str)
         else:
             assert False, "Should not reach here. Should have been caught by pre_run"
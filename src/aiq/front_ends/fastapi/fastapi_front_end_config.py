@@ -15,6 +15,7 @@
 
 import logging
 import typing
+from enum import Enum
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -25,6 +26,11 @@ from aiq.data_models.step_adaptor import StepAdaptorConfig
 logger = logging.getLogger(__name__)
 
 
+class CompressionType(str, Enum):
+    NONE = "none"
+    GZIP = "gzip"
+
+
 class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
     """
     A FastAPI based front end that allows an AgentIQ workflow to be served as a microservice.
@@ -81,7 +87,19 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
     reload: bool = Field(default=False, description="Enable auto-reload for development")
-    workers: int = Field(default=1, description="Number of workers to run", ge=1)
+    workers: int = Field(default=1,
+                         description=("Number of workers to run. When set to 0, the value of the WEB_CONCURRENCY "
+                                      "environment variable is used if set, otherwise the CPU count."),
+                         ge=0)
+    max_concurrency: int = Field(default=8,
+                                 ge=0,
+                                 description=("The maximum number of workflow runs to execute concurrently in each "
+                                              "worker. Set to 0 for no limit."))
+    max_pending: int | None = Field(default=None,
+                                    ge=0,
+                                    description=("The maximum number of workflow runs waiting for a free slot when "
+                                                 "`max_concurrency` is reached. Further requests are rejected with a "
+                                                 "503 response. Defaults to no limit."))
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
@@ -102,6 +120,15 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
         default_factory=CrossOriginResourceSharing,
         description="Cross origin resource sharing configuration for the FastAPI app")
 
+    compression: CompressionType = Field(
+        default=CompressionType.NONE,
+        description=("Compression applied to responses for clients which accept it. Off by default, with gzip the "
+                     "server sent event streams may also be compressed, which can delay the delivery of events."),
+    )
+    compression_minimum_size: int = Field(default=500,
+                                          description="Responses smaller than this many bytes are not compressed.",
+                                          ge=0)
+
     use_gunicorn: bool = Field(
         default=False,
         description="Use Gunicorn to run the FastAPI app",
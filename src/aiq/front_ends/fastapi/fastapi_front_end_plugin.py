@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import importlib.util
+import json
 import os
 import tempfile
 import typing
@@ -23,6 +26,35 @@ from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontE
 from aiq.front_ends.fastapi.main import get_app
 from aiq.utils.io.yaml_tools import yaml_dump
 
+# Linux limits a single environment variable to 128 KiB. Stay well below that and fall back to a config file beyond it
+_MAX_ENV_CONFIG_SIZE = 64 * 1024
+
+
+def _get_event_loop_impl() -> str:
+    """
+    Select uvloop when it is installed (it ships with `uvicorn[standard]` on every platform except Windows), otherwise
+    fall back to the default asyncio event loop.
+    """
+    return "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+
+
+def _get_http_impl() -> str:
+    """
+    Select the httptools HTTP parser when it is installed, otherwise fall back to h11.
+    """
+    return "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+
+def _get_gunicorn_worker_class() -> str:
+    """
+    Select the worker from the `uvicorn-worker` package when it is installed. The worker bundled with uvicorn is
+    deprecated and is only used as a fallback.
+    """
+    if importlib.util.find_spec("uvicorn_worker") is not None:
+        return "uvicorn_worker.UvicornWorker"
+
+    return "uvicorn.workers.UvicornWorker"
+
 
 class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
 
@@ -41,19 +73,49 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
 
         return f"{worker_class.__module__}.{worker_class.__qualname__}"
 
+    def get_workers(self) -> int:
+        """
+        Resolve the number of server processes to launch. An explicit `workers` value is used as-is. When set to 0, the
+        `WEB_CONCURRENCY` environment variable is honored before falling back to the CPU count. Every worker builds
+        its own copy of the workflow, including LLM clients and MCP connections, so the automatic value is not
+        oversubscribed like it would be for synchronous workers.
+        """
+        if (self.front_end_config.workers > 0):
+            return self.front_end_config.workers
+
+        web_concurrency = os.getenv("WEB_CONCURRENCY")
+        if (web_concurrency):
+            return max(int(web_concurrency), 1)
+
+        return os.cpu_count() or 1
+
     async def run(self):
 
-        # Write the entire config to a temporary file
-        with tempfile.NamedTemporaryFile(mode="w", prefix="aiq_config", suffix=".yml", delete=True) as config_file:
+        config_json = self.full_config.model_dump_json(by_alias=True, round_trip=True)
 
-            # Get as dict
-            config_dict = self.full_config.model_dump(mode="json", by_alias=True, round_trip=True)
+        with contextlib.ExitStack() as stack:
+
+            # Remove the config from the environment once the server exits so it does not leak into anything else
+            # started from this process
+            stack.callback(os.environ.pop, "AIQ_CONFIG_JSON", None)
+
+            # The limit applies to the encoded size, non-ASCII characters take more than one byte each
+            if (len(config_json.encode("utf-8")) <= _MAX_ENV_CONFIG_SIZE):
+                # Hand the config to the workers in memory through the environment
+                os.environ["AIQ_CONFIG_JSON"] = config_json
+            else:
+                # The config is too large to be passed in the environment, write it to a temporary file instead
+                config_file = stack.enter_context(
+                    tempfile.NamedTemporaryFile(mode="w", prefix="aiq_config", suffix=".yml", delete=True))
 
-            # Write to YAML file
-            yaml_dump(config_dict, config_file)
+                # Reuse the JSON dump rather than serializing the config a second time. Python mode values such as
+                # enums and paths would need custom representers to be loadable with `yaml.safe_load`
+                yaml_dump(json.loads(config_json), config_file)
 
-            # Set the config file in the environment
-            os.environ["AIQ_CONFIG_FILE"] = str(config_file.name)
+                # Set the config file in the environment
+                os.environ.pop("AIQ_CONFIG_JSON", None)
+                os.environ["AIQ_CONFIG_FILE"] = str(config_file.name)
+                stack.callback(os.environ.pop, "AIQ_CONFIG_FILE", None)
 
             # Set the worker class in the environment
             os.environ["AIQ_FRONT_END_WORKER"] = self.get_worker_class_name()
@@ -66,17 +128,19 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
                 uvicorn.run("aiq.front_ends.fastapi.main:get_app",
                             host=self.front_end_config.host,
                             port=self.front_end_config.port,
-                            workers=self.front_end_config.workers,
+                            workers=self.get_workers(),
                             reload=self.front_end_config.reload,
                             factory=True,
-                            reload_excludes=reload_excludes)
+                            reload_excludes=reload_excludes,
+                            loop=_get_event_loop_impl(),
+                            http=_get_http_impl())
 
             else:
                 app = get_app()
 
-                from gunicorn.app.wsgiapp import WSGIApplication
+                from gunicorn.app.base import BaseApplication
 
-                class StandaloneApplication(WSGIApplication):
+                class StandaloneApplication(BaseApplication):
 
                     def __init__(self, app, options=None):
                         self.options = options or {}
@@ -96,8 +160,11 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
 
                 options = {
                     "bind": f"{self.front_end_config.host}:{self.front_end_config.port}",
-                    "workers": self.front_end_config.workers,
-                    "worker_class": "uvicorn.workers.UvicornWorker",
+                    "workers": self.get_workers(),
+                    "worker_class": _get_gunicorn_worker_class(),
+                    # The app (and parsed config) is built once in the master and shared with the forked workers. Per
+                    # worker resources such as the workflow and its clients are only created in the app's lifespan
+                    "preload_app": True,
                 }
 
                 StandaloneApplication(app, options=options).run()
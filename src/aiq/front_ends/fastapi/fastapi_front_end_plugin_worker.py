@@ -18,15 +18,20 @@ import os
 import typing
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from functools import partial
 
 from fastapi import Body
 from fastapi import FastAPI
+from fastapi import Request
 from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.data_models.api_server import AIQChatRequest
@@ -34,16 +39,116 @@ from aiq.data_models.api_server import AIQChatResponse
 from aiq.data_models.api_server import AIQChatResponseChunk
 from aiq.data_models.api_server import AIQResponseIntermediateStep
 from aiq.data_models.config import AIQConfig
+from aiq.front_ends.fastapi.fastapi_front_end_config import CompressionType
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
 from aiq.front_ends.fastapi.websocket import AIQWebSocket
+from aiq.runtime.session import AIQOverloadedError
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
 
 
+class _JSONResponse(Response):
+    """
+    Response for content which has already been serialized to JSON. The media type is set at class scope so no headers
+    need to be built per request.
+    """
+    media_type = "application/json"
+
+
+class _EventStreamResponse(StreamingResponse):
+    """
+    Server sent event stream response. Starlette appends `; charset=utf-8` to the `text/event-stream` media type.
+    """
+    media_type = "text/event-stream"
+
+
+_RESPONSE_500 = {
+    "description": "Internal Server Error",
+    "content": {
+        "application/json": {
+            "example": {
+                "detail": "Internal server error occurred"
+            }
+        }
+    },
+}
+
+
+def _get_single_endpoint(session_manager: AIQSessionManager, result_type: type | None):
+
+    # Build the serializer once per route. Returning a `Response` directly skips FastAPI re-validating and re-encoding
+    # a result which is already converted to `result_type`
+    result_adapter = TypeAdapter(result_type)
+
+    async def get_single():
+
+        result = await generate_single_response(None, session_manager, result_type=result_type)
+
+        return _JSONResponse(content=result_adapter.dump_json(result, by_alias=True))
+
+    return get_single
+
+
+def _get_streaming_endpoint(session_manager: AIQSessionManager,
+                            get_step_adaptor: Callable[[], StepAdaptor],
+                            streaming: bool,
+                            result_type: type | None,
+                            output_type: type | None):
+
+    async def get_stream():
+
+        # Reject the run before the response starts, once streaming has begun the status can no longer be changed
+        session_manager.check_admission()
+
+        return _EventStreamResponse(content=generate_streaming_response_as_str(None,
+                                                                               session_manager=session_manager,
+                                                                               streaming=streaming,
+                                                                               step_adaptor=get_step_adaptor(),
+                                                                               result_type=result_type,
+                                                                               output_type=output_type))
+
+    return get_stream
+
+
+def _post_single_endpoint(session_manager: AIQSessionManager, request_type: type, result_type: type | None):
+
+    result_adapter = TypeAdapter(result_type)
+
+    async def post_single(payload: request_type):
+
+        result = await generate_single_response(payload, session_manager, result_type=result_type)
+
+        return _JSONResponse(content=result_adapter.dump_json(result, by_alias=True))
+
+    return post_single
+
+
+def _post_streaming_endpoint(session_manager: AIQSessionManager,
+                             get_step_adaptor: Callable[[], StepAdaptor],
+                             request_type: type,
+                             streaming: bool,
+                             result_type: type | None,
+                             output_type: type | None):
+
+    async def post_stream(payload: request_type):
+
+        # Reject the run before the response starts, once streaming has begun the status can no longer be changed
+        session_manager.check_admission()
+
+        return _EventStreamResponse(content=generate_streaming_response_as_str(payload,
+                                                                               session_manager=session_manager,
+                                                                               streaming=streaming,
+                                                                               step_adaptor=get_step_adaptor(),
+                                                                               result_type=result_type,
+                                                                               output_type=output_type))
+
+    return post_stream
+
+
 class FastApiFrontEndPluginWorkerBase(ABC):
 
     def __init__(self, config: AIQConfig):
@@ -79,44 +184,38 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
             logger.debug("Closing AgentIQ server from process %s", os.getpid())
 
-        aiq_app = FastAPI(lifespan=lifespan)
+        # Use orjson for any route that returns plain python objects rather than a prebuilt response
+        aiq_app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
         self.set_cors_config(aiq_app)
 
+        self.set_compression_config(aiq_app)
+
         return aiq_app
 
     def set_cors_config(self, aiq_app: FastAPI) -> None:
         """
         Set the cross origin resource sharing configuration.
         """
-        cors_kwargs = {}
-
-        if self.front_end_config.cors.allow_origins is not None:
-            cors_kwargs["allow_origins"] = self.front_end_config.cors.allow_origins
-
-        if self.front_end_config.cors.allow_origin_regex is not None:
-            cors_kwargs["allow_origin_regex"] = self.front_end_config.cors.allow_origin_regex
-
-        if self.front_end_config.cors.allow_methods is not None:
-            cors_kwargs["allow_methods"] = self.front_end_config.cors.allow_methods
-
-        if self.front_end_config.cors.allow_headers is not None:
-            cors_kwargs["allow_headers"] = self.front_end_config.cors.allow_headers
-
-        if self.front_end_config.cors.allow_credentials is not None:
-            cors_kwargs["allow_credentials"] = self.front_end_config.cors.allow_credentials
-
-        if self.front_end_config.cors.expose_headers is not None:
-            cors_kwargs["expose_headers"] = self.front_end_config.cors.expose_headers
-
-        if self.front_end_config.cors.max_age is not None:
-            cors_kwargs["max_age"] = self.front_end_config.cors.max_age
+        # Unset options are left as None so they fall back to the CORSMiddleware defaults
+        cors_kwargs = self.front_end_config.cors.model_dump(exclude_none=True)
 
         aiq_app.add_middleware(
             CORSMiddleware,
             **cors_kwargs,
         )
 
+    def set_compression_config(self, aiq_app: FastAPI) -> None:
+        """
+        Set the response compression configuration. Compression is off unless configured. Depending on the Starlette
+        version, the GZip middleware also compresses `text/event-stream` responses, and buffering in the compressor can
+        make clients of the streaming endpoints receive events late.
+        """
+        if self.front_end_config.compression == CompressionType.GZIP:
+            aiq_app.add_middleware(GZipMiddleware,
+                                   minimum_size=self.front_end_config.compression_minimum_size,
+                                   compresslevel=1)
+
     @abstractmethod
     async def configure(self, app: FastAPI, builder: WorkflowBuilder):
         pass
@@ -134,6 +233,10 @@ class RouteInfo(BaseModel):
 class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
     def get_step_adaptor(self) -> StepAdaptor:
+        """
+        Returns a new step adaptor. A `StepAdaptor` records the history of the intermediate steps it has processed,
+        so each request must get its own instance rather than sharing a cached one.
+        """
 
         return StepAdaptor(self.front_end_config.step_adaptor)
 
@@ -142,17 +245,30 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         # Do things like setting the base URL and global configuration options
         app.root_path = self.front_end_config.root_path
 
+        async def overloaded_handler(request: Request, exc: AIQOverloadedError):
+            return ORJSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+        app.add_exception_handler(AIQOverloadedError, overloaded_handler)
+
         await self.add_routes(app, builder)
 
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
 
-        await self.add_default_route(app, AIQSessionManager(builder.build()))
+        max_concurrency = self.front_end_config.max_concurrency
+        max_pending = self.front_end_config.max_pending
+
+        await self.add_default_route(
+            app, AIQSessionManager(builder.build(), max_concurrency=max_concurrency, max_pending=max_pending))
 
         for ep in self.front_end_config.endpoints:
 
             entry_workflow = builder.build(entry_function=ep.function_name)
 
-            await self.add_route(app, endpoint=ep, session_manager=AIQSessionManager(entry_workflow))
+            await self.add_route(app,
+                                 endpoint=ep,
+                                 session_manager=AIQSessionManager(entry_workflow,
+                                                                   max_concurrency=max_concurrency,
+                                                                   max_pending=max_pending))
 
     async def add_default_route(self, app: FastAPI, session_manager: AIQSessionManager):
 
@@ -174,118 +290,59 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         GenerateSingleResponseType = workflow.single_output_schema  # pylint: disable=invalid-name
 
         # Ensure that the input is in the body. POD types are treated as query parameters
-        if (not issubclass(GenerateBodyType, BaseModel)):
+        if (not (isinstance(GenerateBodyType, type) and issubclass(GenerateBodyType, BaseModel))):
             GenerateBodyType = typing.Annotated[GenerateBodyType, Body()]
 
-        response_500 = {
-            "description": "Internal Server Error",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Internal server error occurred"
-                    }
-                }
-            },
-        }
-
-        def get_single_endpoint(result_type: type | None):
-
-            async def get_single(response: Response):
-
-                response.headers["Content-Type"] = "application/json"
-
-                return await generate_single_response(None, session_manager, result_type=result_type)
-
-            return get_single
-
-        def get_streaming_endpoint(streaming: bool, result_type: type | None, output_type: type | None):
-
-            async def get_stream():
-
-                return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
-                                         content=generate_streaming_response_as_str(
-                                             None,
-                                             session_manager=session_manager,
-                                             streaming=streaming,
-                                             step_adaptor=self.get_step_adaptor(),
-                                             result_type=result_type,
-                                             output_type=output_type))
-
-            return get_stream
-
-        def post_single_endpoint(request_type: type, result_type: type | None):
-
-            async def post_single(response: Response, payload: request_type):
-
-                response.headers["Content-Type"] = "application/json"
-
-                return await generate_single_response(payload, session_manager, result_type=result_type)
-
-            return post_single
-
-        def post_streaming_endpoint(request_type: type,
-                                    streaming: bool,
-                                    result_type: type | None,
-                                    output_type: type | None):
-
-            async def post_stream(payload: request_type):
-
-                return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
-                                         content=generate_streaming_response_as_str(
-                                             payload,
-                                             session_manager=session_manager,
-                                             streaming=streaming,
-                                             step_adaptor=self.get_step_adaptor(),
-                                             result_type=result_type,
-                                             output_type=output_type))
-
-            return post_stream
-
         if (endpoint.path):
             if (endpoint.method == "GET"):
 
                 app.add_api_route(
                     path=endpoint.path,
-                    endpoint=get_single_endpoint(result_type=GenerateSingleResponseType),
+                    endpoint=_get_single_endpoint(session_manager, result_type=GenerateSingleResponseType),
                     methods=[endpoint.method],
                     response_model=GenerateSingleResponseType,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
                 app.add_api_route(
                     path=f"{endpoint.path}/stream",
-                    endpoint=get_streaming_endpoint(streaming=True,
-                                                    result_type=GenerateStreamResponseType,
-                                                    output_type=GenerateStreamResponseType),
+                    endpoint=_get_streaming_endpoint(session_manager,
+                                                     self.get_step_adaptor,
+                                                     streaming=True,
+                                                     result_type=GenerateStreamResponseType,
+                                                     output_type=GenerateStreamResponseType),
                     methods=[endpoint.method],
                     response_model=GenerateStreamResponseType,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
             elif (endpoint.method == "POST"):
 
                 app.add_api_route(
                     path=endpoint.path,
-                    endpoint=post_single_endpoint(request_type=GenerateBodyType,
-                                                  result_type=GenerateSingleResponseType),
+                    endpoint=_post_single_endpoint(session_manager,
+                                                   request_type=GenerateBodyType,
+                                                   result_type=GenerateSingleResponseType),
                     methods=[endpoint.method],
                     response_model=GenerateSingleResponseType,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
                 app.add_api_route(
                     path=f"{endpoint.path}/stream",
-                    endpoint=post_streaming_endpoint(request_type=GenerateBodyType,
-                                                     streaming=True,
-                                                     result_type=GenerateStreamResponseType,
-                                                     output_type=GenerateStreamResponseType),
+                    endpoint=_post_streaming_endpoint(session_manager,
+                                                      self.get_step_adaptor,
+                                                      request_type=GenerateBodyType,
+                                                      streaming=True,
+                                                      result_type=GenerateStreamResponseType,
+                                                      output_type=GenerateStreamResponseType),
                     methods=[endpoint.method],
                     response_model=GenerateStreamResponseType,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
             else:
@@ -296,45 +353,51 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=endpoint.openai_api_path,
-                    endpoint=get_single_endpoint(result_type=AIQChatResponse),
+                    endpoint=_get_single_endpoint(session_manager, result_type=AIQChatResponse),
                     methods=[endpoint.method],
                     response_model=AIQChatResponse,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
                 app.add_api_route(
                     path=f"{endpoint.openai_api_path}/stream",
-                    endpoint=get_streaming_endpoint(streaming=True,
-                                                    result_type=AIQChatResponseChunk,
-                                                    output_type=AIQChatResponseChunk),
+                    endpoint=_get_streaming_endpoint(session_manager,
+                                                     self.get_step_adaptor,
+                                                     streaming=True,
+                                                     result_type=AIQChatResponseChunk,
+                                                     output_type=AIQChatResponseChunk),
                     methods=[endpoint.method],
                     response_model=AIQChatResponseChunk,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
             elif (endpoint.method == "POST"):
 
                 app.add_api_route(
                     path=endpoint.openai_api_path,
-                    endpoint=post_single_endpoint(request_type=AIQChatRequest, result_type=AIQChatResponse),
+                    endpoint=_post_single_endpoint(session_manager,
+                                                   request_type=AIQChatRequest,
+                                                   result_type=AIQChatResponse),
                     methods=[endpoint.method],
                     response_model=AIQChatResponse,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
                 app.add_api_route(
                     path=f"{endpoint.openai_api_path}/stream",
-                    endpoint=post_streaming_endpoint(request_type=AIQChatRequest,
-                                                     streaming=True,
-                                                     result_type=AIQChatResponseChunk,
-                                                     output_type=AIQChatResponseChunk),
+                    endpoint=_post_streaming_endpoint(session_manager,
+                                                      self.get_step_adaptor,
+                                                      request_type=AIQChatRequest,
+                                                      streaming=True,
+                                                      result_type=AIQChatResponseChunk,
+                                                      output_type=AIQChatResponseChunk),
                     methods=[endpoint.method],
                     response_model=AIQChatResponseChunk | AIQResponseIntermediateStep,
                     description=endpoint.description,
-                    responses={500: response_500},
+                    responses={500: _RESPONSE_500},
                 )
 
             else:
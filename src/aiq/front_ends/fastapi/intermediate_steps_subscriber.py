@@ -38,11 +38,11 @@ async def pull_intermediate(_q, adapter):
     def on_next_cb(item: IntermediateStep):
         """
         Synchronously called whenever the runner publishes an event.
-        We process it, then place it into the async queue (via a small async task).
+        We process it, then place it into the queue directly, which keeps the events in order.
         """
         adapted = adapter.process(item)
-        if adapted is not None:
-            loop.create_task(_q.put(adapted))
+        if adapted is not None and not _q.is_closed():
+            _q.put(adapted)
 
     def on_error_cb(exc: Exception):
         """
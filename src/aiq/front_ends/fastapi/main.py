@@ -19,17 +19,19 @@ import os
 
 from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorkerBase
 from aiq.runtime.loader import load_config
+from aiq.runtime.loader import load_config_json
 
 logger = logging.getLogger(__name__)
 
 
 def get_app():
 
+    config_json = os.getenv("AIQ_CONFIG_JSON")
     config_file_path = os.getenv("AIQ_CONFIG_FILE")
     front_end_worker_full_name = os.getenv("AIQ_FRONT_END_WORKER")
 
-    if (not config_file_path):
-        raise ValueError("Config file not found in environment variable AIQ_CONFIG_FILE.")
+    if (not config_json and not config_file_path):
+        raise ValueError("Config not found in environment variables AIQ_CONFIG_JSON or AIQ_CONFIG_FILE.")
 
     if (not front_end_worker_full_name):
         raise ValueError("Front end worker not found in environment variable AIQ_FRONT_END_WORKER.")
@@ -54,10 +56,13 @@ def get_app():
             raise ValueError(
                 f"Front end worker {front_end_worker_full_name} is not a subclass of FastApiFrontEndPluginWorker.")
 
-        # Load the config
-        abs_config_file_path = os.path.abspath(config_file_path)
+        # Load the config, preferring the in-memory copy over the config file
+        if (config_json):
+            config = load_config_json(config_json)
+        else:
+            abs_config_file_path = os.path.abspath(config_file_path)
 
-        config = load_config(abs_config_file_path)
+            config = load_config(abs_config_file_path)
 
         # Create an instance of the front end worker class
         front_end_worker = front_end_worker_class(config)
@@ -16,6 +16,8 @@
 import asyncio
 import logging
 import uuid
+from collections.abc import Awaitable
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import WebSocket
@@ -39,17 +41,25 @@ from aiq.data_models.interactive import HumanResponse
 from aiq.data_models.interactive import HumanResponseNotification
 from aiq.data_models.interactive import InteractionPrompt
 from aiq.front_ends.fastapi.message_validator import MessageValidator
+from aiq.utils.producer_consumer_queue import SingleConsumerQueue
 
 logger = logging.getLogger(__name__)
 
+_MAX_OUT_GOING_BATCH_SIZE = 64
+
 
 class MessageHandler:
 
     def __init__(self, websocket_reference: WebSocketEndpoint):
         self._websocket_reference: WebSocketEndpoint = websocket_reference
         self._message_validator: MessageValidator = MessageValidator()
-        self._messages_queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
-        self._out_going_messages_queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._message_builders: dict[type[BaseModel], Callable[..., Awaitable[BaseModel | None]]] = {
+            WebSocketSystemResponseTokenMessage: self._message_validator.create_system_response_token_message,
+            WebSocketSystemIntermediateStepMessage: self._message_validator.create_system_intermediate_step_message,
+            WebSocketSystemInteractionMessage: self._message_validator.create_system_interaction_message
+        }
+        self._messages_queue: SingleConsumerQueue[dict[str, str]] = SingleConsumerQueue()
+        self._out_going_messages_queue: SingleConsumerQueue[str] = SingleConsumerQueue()
         self._process_messages_task: asyncio.Task | None = None
         self._process_out_going_messages_task: asyncio.Task = None
         self._background_task: asyncio.Task = None
@@ -58,7 +68,7 @@ class MessageHandler:
         self._user_interaction_response: asyncio.Future[TextContent] = asyncio.Future()
 
     @property
-    def messages_queue(self) -> asyncio.Queue[dict[str, str]]:
+    def messages_queue(self) -> SingleConsumerQueue[dict[str, str]]:
         return self._messages_queue
 
     @property
@@ -95,23 +105,20 @@ class MessageHandler:
                 if (isinstance(validated_message, WebSocketUserMessage)):
                     await self.process_user_message(validated_message)
 
-                if isinstance(
-                        validated_message,
-                    (  # noqa: E131
-                        WebSocketSystemResponseTokenMessage,
-                        WebSocketSystemIntermediateStepMessage,
-                        WebSocketSystemInteractionMessage)):
-                    await self._out_going_messages_queue.put(validated_message.model_dump())
-
-                if (isinstance(validated_message, WebSocketUserInteractionResponseMessage)):
-                    user_content = await self.process_user_message_content(validated_message)
+                elif (isinstance(validated_message, WebSocketUserInteractionResponseMessage)):
+                    user_content = self.process_user_message_content(validated_message)
                     self._user_interaction_response.set_result(user_content)
+
+                # Report incoming messages that failed validation back to the client
+                elif (isinstance(validated_message, WebSocketSystemResponseTokenMessage)
+                        and validated_message.type == WebSocketMessageType.ERROR_MESSAGE):
+                    self._out_going_messages_queue.put(validated_message.model_dump_json())
             except (asyncio.CancelledError):
                 break
 
         return None
 
-    async def process_user_message_content(
+    def process_user_message_content(
             self, user_content: WebSocketUserMessage | WebSocketUserInteractionResponseMessage) -> BaseModel | None:
         """
         Processes the contents of a user message.
@@ -120,7 +127,7 @@ class MessageHandler:
         :return: A validated Pydantic user content model or None if not found.
         """
 
-        for user_message in user_content.content.messages[::-1]:
+        for user_message in reversed(user_content.content.messages):
             if (user_message.role == "user"):
 
                 for attachment in user_message.content:
@@ -141,18 +148,18 @@ class MessageHandler:
             self._message_parent_id = message_as_validated_type.id
             self._workflow_schema_type = message_as_validated_type.schema_type
 
-            content: BaseModel | None = await self.process_user_message_content(message_as_validated_type)
+            content: BaseModel | None = self.process_user_message_content(message_as_validated_type)
 
             if content is None:
                 raise ValueError(f"User message content could not be found: {message_as_validated_type}")
 
             if isinstance(content, TextContent) and (self._background_task is None):
 
-                await self._process_response()
-                self._background_task = asyncio.create_task(
-                    self._websocket_reference.workflow_schema_type.get(self._workflow_schema_type)(
-                        content.text)).add_done_callback(
-                            lambda task: asyncio.create_task(self._on_process_stream_task_done(task)))
+                self._process_response()
+                background_task = asyncio.create_task(
+                    self._websocket_reference.workflow_schema_type.get(self._workflow_schema_type)(content.text))
+                background_task.add_done_callback(self._on_process_stream_task_done)
+                self._background_task = background_task
 
         except ValueError as e:
             logger.error("User message content not found: %s", str(e), exc_info=True)
@@ -188,20 +195,18 @@ class MessageHandler:
 
             content: BaseModel = await self._message_validator.convert_data_to_message_content(data_model)
 
-            if issubclass(message_schema, WebSocketSystemResponseTokenMessage):
-                message = await self._message_validator.create_system_response_token_message(
-                    message_id=message_id, parent_id=self._message_parent_id, content=content, status=status)
+            message_builder = self._message_builders.get(message_schema)
 
-            elif issubclass(message_schema, WebSocketSystemIntermediateStepMessage):
-                message = await self._message_validator.create_system_intermediate_step_message(
-                    message_id=message_id,
-                    parent_id=await self._message_validator.get_intermediate_step_parent_id(data_model),
-                    content=content,
-                    status=status)
+            if message_builder is not None:
+                if message_schema is WebSocketSystemIntermediateStepMessage:
+                    parent_id = await self._message_validator.get_intermediate_step_parent_id(data_model)
+                else:
+                    parent_id = self._message_parent_id
 
-            elif issubclass(message_schema, WebSocketSystemInteractionMessage):
-                message = await self._message_validator.create_system_interaction_message(
-                    message_id=message_id, parent_id=self._message_parent_id, content=content, status=status)
+                message = await message_builder(message_id=message_id,
+                                                parent_id=parent_id,
+                                                content=content,
+                                                status=status)
 
             elif isinstance(content, Error):
                 raise ValidationError(f"Invalid input data creating websocket message. {data_model.model_dump_json()}")
@@ -220,12 +225,26 @@ class MessageHandler:
                 content=Error(code=ErrorTypes.UNKNOWN_ERROR, message="default", details=str(e)))
 
         finally:
-            await self._messages_queue.put(message.model_dump())
-
-    async def _on_process_stream_task_done(self, task: asyncio.Task) -> None:
-        await self.create_websocket_message(data_model=SystemResponseContent(),
-                                            message_type=WebSocketMessageType.RESPONSE_MESSAGE,
-                                            status=WebSocketMessageStatus.COMPLETE)
+            # Messages created here are already validated models, so send them directly rather than routing them back
+            # through the incoming queue. Encode once here so the sender can write the frame as is.
+            self._out_going_messages_queue.put(message.model_dump_json())
+
+    def _on_process_stream_task_done(self, task: asyncio.Task) -> None:
+        self._background_task = None
+
+        if (not task.cancelled() and task.exception() is not None):
+            logger.error("Error processing workflow for message: %s",
+                         self._message_parent_id,
+                         exc_info=task.exception())
+
+        # Called synchronously by the event loop, so build the completion message directly instead of scheduling
+        # another task to go through `create_websocket_message`
+        message = WebSocketSystemResponseTokenMessage(type=WebSocketMessageType.RESPONSE_MESSAGE,
+                                                      id=str(uuid.uuid4()),
+                                                      parent_id=self._message_parent_id,
+                                                      content=SystemResponseContent(),
+                                                      status=WebSocketMessageStatus.COMPLETE)
+        self._out_going_messages_queue.put(message.model_dump_json())
 
         return None
 
@@ -237,21 +256,27 @@ class MessageHandler:
         """
         while True:
             try:
-                out_going_message = await self._out_going_messages_queue.get()
-                await self._websocket_reference.on_send(websocket, out_going_message)
+                # Drain everything that is already queued after the first wake-up so a burst of streamed tokens is
+                # sent back-to-back instead of waiting on the queue once per message. Each message is still sent as
+                # its own frame, since clients expect one JSON message per frame.
+                out_going_messages = [await self._out_going_messages_queue.get()]
+                out_going_messages.extend(self._out_going_messages_queue.drain(_MAX_OUT_GOING_BATCH_SIZE - 1))
+
+                for out_going_message in out_going_messages:
+                    await self._websocket_reference.on_send(websocket, out_going_message)
 
             except (asyncio.CancelledError, ValidationError):
                 break
 
         return None
 
-    async def _process_response(self):
+    def _process_response(self):
         self._websocket_reference.process_response_event.set()
 
-    async def _pause_response(self):
+    def _pause_response(self):
         self._websocket_reference.process_response_event.clear()
 
-    async def __reset_user_interaction_response(self):
+    def __reset_user_interaction_response(self):
         self._user_interaction_response = asyncio.Future()
 
     async def human_interaction(self, prompt: InteractionPrompt) -> HumanResponse:
@@ -266,6 +291,7 @@ class MessageHandler:
                                             message_type=WebSocketMessageType.SYSTEM_INTERACTION_MESSAGE,
                                             status=WebSocketMessageStatus.IN_PROGRESS)
 
+        # Notifications need no reply, so return without waiting on the user
         if (isinstance(prompt.content, HumanPromptNotification)):
             return HumanResponseNotification()
 
@@ -273,7 +299,7 @@ class MessageHandler:
         interaction_response: HumanResponse = await self._message_validator.convert_text_content_to_human_response(
             user_message_repsonse_content, prompt.content)
 
-        await self.__reset_user_interaction_response()
-        await self._process_response()
+        self.__reset_user_interaction_response()
+        self._process_response()
 
         return interaction_response
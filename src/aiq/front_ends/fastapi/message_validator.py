@@ -77,6 +77,7 @@ class MessageValidator:
             WorkflowSchemaType.GENERATE_STREAM: AIQResponseIntermediateStep,
         }
         self._message_parent_id: str = "default_id"
+        self._resolved_message_types: dict[type[BaseModel], str] = {}
 
     async def validate_message(self, message: dict[str, Any]) -> BaseModel:
         """
@@ -99,7 +100,7 @@ class MessageValidator:
                 raise TypeError(
                     f"An error was encountered processing an incoming WebSocket message of type: {message_type}")
 
-            validated_message = schema(**message)
+            validated_message = schema.model_validate(message)
             return validated_message
 
         except (ValidationError, TypeError, ValueError) as e:
@@ -204,7 +205,11 @@ class MessageValidator:
         :return: A WebSocket Message Content Data Model instance.
         """
 
-        validated_message_type: str = ""
+        data_type = type(data_model)
+        validated_message_type: str | None = self._resolved_message_types.get(data_type)
+        if (validated_message_type is not None):
+            return validated_message_type
+
         try:
             if (isinstance(data_model, (AIQResponsePayloadOutput, AIQChatResponse, AIQChatResponseChunk))):
                 validated_message_type = WebSocketMessageType.RESPONSE_MESSAGE
@@ -217,6 +222,8 @@ class MessageValidator:
             else:
                 raise ValueError("Data type not found")
 
+            self._resolved_message_types[data_type] = validated_message_type
+
             return validated_message_type
 
         except ValueError as e:
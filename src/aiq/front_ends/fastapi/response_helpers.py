@@ -14,23 +14,32 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import typing
 from collections.abc import AsyncGenerator
 
 from aiq.data_models.api_server import AIQResponsePayloadOutput
 from aiq.data_models.api_server import AIQResponseSerializable
 from aiq.data_models.step_adaptor import StepAdaptorConfig
+from aiq.data_models.step_adaptor import StepAdaptorMode
 from aiq.front_ends.fastapi.intermediate_steps_subscriber import pull_intermediate
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
 from aiq.runtime.session import AIQSessionManager
-from aiq.utils.producer_consumer_queue import AsyncIOProducerConsumerQueue
+from aiq.utils.producer_consumer_queue import SingleConsumerQueue
+
+
+def _to_serializable(item: typing.Any) -> AIQResponseSerializable:
+    if (isinstance(item, AIQResponseSerializable)):
+        return item
+
+    return AIQResponsePayloadOutput(payload=item)
 
 
 async def generate_streaming_response_as_str(payload: typing.Any,
                                              *,
                                              session_manager: AIQSessionManager,
                                              streaming: bool,
-                                             step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
+                                             step_adaptor: StepAdaptor | None = None,
                                              result_type: type | None = None,
                                              output_type: type | None = None) -> AsyncGenerator[str]:
 
@@ -52,56 +61,65 @@ async def generate_streaming_response(payload: typing.Any,
                                       *,
                                       session_manager: AIQSessionManager,
                                       streaming: bool,
-                                      step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
+                                      step_adaptor: StepAdaptor | None = None,
                                       result_type: type | None = None,
                                       output_type: type | None = None) -> AsyncGenerator[AIQResponseSerializable]:
 
-    async with session_manager.run(payload) as runner:
-
-        q: AsyncIOProducerConsumerQueue[AIQResponseSerializable] = AsyncIOProducerConsumerQueue()
+    if (step_adaptor is None):
+        # StepAdaptor keeps a per-request history, so a default instance cannot be shared between calls
+        step_adaptor = StepAdaptor(StepAdaptorConfig())
 
-        # Start the intermediate stream
-        intermediate_complete = await pull_intermediate(q, step_adaptor)
+    async with session_manager.run(payload) as runner:
 
-        async def pull_result():
+        # With the step adaptor turned off no intermediate steps are ever emitted, so yield the results directly
+        # instead of routing them through the intermediate queue
+        if (step_adaptor.config.mode == StepAdaptorMode.OFF):
             if session_manager.workflow.has_streaming_output and streaming:
                 async for chunk in runner.result_stream(to_type=output_type):
-                    await q.put(chunk)
+                    yield _to_serializable(chunk)
             else:
                 result = await runner.result(to_type=result_type)
-                await q.put(runner.convert(result, output_type))
+                yield _to_serializable(runner.convert(result, output_type))
 
-            # Wait until the intermediate subscription is done before closing q
-            # But we have no direct "intermediate_done" reference here
-            # because it's encapsulated in pull_intermediate. So we can do:
-            #    await some_event.wait()
-            # If needed. Alternatively, you can skip that if the intermediate
-            # subscriber won't block the main flow.
-            #
-            # For example, if you *need* to guarantee the subscriber is done before
-            # closing the queue, you can structure the code to store or return
-            # the 'intermediate_done' event from pull_intermediate.
-            #
+            return
 
-            await intermediate_complete.wait()
+        q: SingleConsumerQueue[AIQResponseSerializable] = SingleConsumerQueue()
 
-            await q.close()
+        # Start the intermediate stream
+        intermediate_complete = await pull_intermediate(q, step_adaptor)
 
-        try:
-            # Start the result stream
-            asyncio.create_task(pull_result())
+        async def pull_result():
+            try:
+                if session_manager.workflow.has_streaming_output and streaming:
+                    async for chunk in runner.result_stream(to_type=output_type):
+                        q.put(chunk)
+                else:
+                    result = await runner.result(to_type=result_type)
+                    q.put(runner.convert(result, output_type))
+
+                # Wait until the intermediate subscription is done before closing q so no intermediate steps are lost
+                await intermediate_complete.wait()
+            finally:
+                # Always close q, even on error, so the consumer below does not wait forever
+                q.close()
 
+        # Start the result stream
+        pull_task = asyncio.create_task(pull_result())
+
+        try:
             async for item in q:
+                yield _to_serializable(item)
 
-                if (isinstance(item, AIQResponseSerializable)):
-                    yield item
-                else:
-                    yield AIQResponsePayloadOutput(payload=item)
-        except Exception as e:
-            # Handle exceptions here
-            raise e
+            # Re-raise any error from producing the result now that the queue has been drained
+            await pull_task
         finally:
-            await q.close()
+            if not pull_task.done():
+                # The consumer stopped early, stop producing results
+                pull_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pull_task
+
+            q.close()
 
 
 async def generate_single_response(
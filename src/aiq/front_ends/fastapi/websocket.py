@@ -20,9 +20,12 @@ from collections.abc import Awaitable
 from collections.abc import Callable
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 from fastapi import WebSocketException
 from starlette.endpoints import WebSocketEndpoint
+from starlette.status import WS_1003_UNSUPPORTED_DATA
+from starlette.types import Message
 from starlette.websockets import WebSocketDisconnect
 
 from aiq.data_models.api_server import AIQChatRequest
@@ -30,11 +33,15 @@ from aiq.data_models.api_server import AIQChatResponse
 from aiq.data_models.api_server import AIQChatResponseChunk
 from aiq.data_models.api_server import AIQResponsePayloadOutput
 from aiq.data_models.api_server import AIQResponseSerializable
+from aiq.data_models.api_server import Error
+from aiq.data_models.api_server import ErrorTypes
 from aiq.data_models.api_server import WebSocketMessageStatus
+from aiq.data_models.api_server import WebSocketMessageType
 from aiq.data_models.api_server import WorkflowSchemaType
 from aiq.front_ends.fastapi.message_handler import MessageHandler
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
+from aiq.runtime.session import AIQOverloadedError
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
@@ -82,15 +89,28 @@ class AIQWebSocket(WebSocketEndpoint):
         except (WebSocketDisconnect, WebSocketException):
             logger.error("A WebSocket error occured during `on_connect`. Ignoring the connection.", exc_info=True)
 
-    async def on_send(self, websocket: WebSocket, data: dict[str, str]):
+    async def decode(self, websocket: WebSocket, message: Message) -> Any:
+        # Same behavior as the starlette "json" encoding, but parsed with orjson
+        text = message.get("text")
         try:
-            await websocket.send_json(data)
+            return orjson.loads(text if text is not None else message["bytes"])
+        except orjson.JSONDecodeError as e:
+            await websocket.close(code=WS_1003_UNSUPPORTED_DATA)
+            raise RuntimeError("Malformed JSON data received.") from e
+
+    async def on_send(self, websocket: WebSocket, data: str | dict[str, str]):
+        try:
+            # Messages are sent as text frames to match `send_json`. Pre-encoded messages are sent as is
+            if not isinstance(data, str):
+                data = orjson.dumps(data).decode()
+
+            await websocket.send_text(data)
         except (WebSocketDisconnect, WebSocketException, Exception):
             logger.error("A WebSocket error occurred during `on_send`. Ignoring the connection.", exc_info=True)
 
     async def on_receive(self, websocket: WebSocket, data: dict[str, Any]):
         try:
-            await self._message_handler.messages_queue.put(data)
+            self._message_handler.messages_queue.put(data)
         except (Exception):
             logger.error("An unxpected error occurred during `on_receive`. Ignoring the exception", exc_info=True)
 
@@ -113,6 +133,17 @@ class AIQWebSocket(WebSocketEndpoint):
                                result_type: type | None = None,
                                output_type: type | None = None) -> None:
 
+        try:
+            self._session_manager.check_admission()
+        except AIQOverloadedError as e:
+            error = Error(code=ErrorTypes.SERVER_OVERLOADED,
+                          message="The server is overloaded, retry later",
+                          details=str(e))
+            await self._message_handler.create_websocket_message(data_model=error,
+                                                                 message_type=WebSocketMessageType.ERROR_MESSAGE,
+                                                                 status=WebSocketMessageStatus.COMPLETE)
+            return
+
         async with self._session_manager.session(
                 user_input_callback=self._message_handler.human_interaction) as session:
 
@@ -123,7 +154,9 @@ class AIQWebSocket(WebSocketEndpoint):
                                                            result_type=result_type,
                                                            output_type=output_type):
 
-                await self._process_response_event.wait()
+                # Only wait while a human interaction has paused the response, avoiding a wait per streamed value
+                if not self._process_response_event.is_set():
+                    await self._process_response_event.wait()
 
                 if not isinstance(value, AIQResponseSerializable):
                     value = AIQResponsePayloadOutput(payload=value)
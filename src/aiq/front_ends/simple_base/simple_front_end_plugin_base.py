@@ -16,7 +16,6 @@
 import logging
 from abc import ABC
 from abc import abstractmethod
-from io import StringIO
 
 import click
 
@@ -39,11 +38,7 @@ class SimpleFrontEndPluginBase(FrontEndBase[FrontEndConfigT], ABC):
         async with WorkflowBuilder.from_config(config=self.full_config) as builder:
 
             if logger.isEnabledFor(logging.INFO):
-                stream = StringIO()
-
-                self.full_config.print_summary(stream=stream)
-
-                click.echo(stream.getvalue())
+                self.full_config.print_summary(stream=click.get_text_stream("stdout"))
 
             await self.run_workflow(builder.build())
 
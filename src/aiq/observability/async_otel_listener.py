@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 import logging
+import random
 import re
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -27,20 +31,67 @@ from opentelemetry.trace.propagation import set_span_in_context
 from pydantic import TypeAdapter
 
 from aiq.builder.context import AIQContextState
+from aiq.data_models.config import TraceSamplingConfig
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
 
 logger = logging.getLogger(__name__)
 
 OPENINFERENCE_SPAN_KIND = SpanAttributes.OPENINFERENCE_SPAN_KIND
 
+# Span attribute keys used on every span, resolved once rather than per event
+_INPUT_VALUE = SpanAttributes.INPUT_VALUE
+_INPUT_MIME_TYPE = SpanAttributes.INPUT_MIME_TYPE
+_OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE
+_OUTPUT_MIME_TYPE = SpanAttributes.OUTPUT_MIME_TYPE
+_LLM_TOKEN_COUNT_PROMPT = SpanAttributes.LLM_TOKEN_COUNT_PROMPT
+_LLM_TOKEN_COUNT_COMPLETION = SpanAttributes.LLM_TOKEN_COUNT_COMPLETION
+_LLM_TOKEN_COUNT_TOTAL = SpanAttributes.LLM_TOKEN_COUNT_TOTAL
+
+# Maximum number of intermediate steps waiting to be turned into spans. Steps arriving while the queue is full are
+# dropped rather than blocking the workflow.
+_MAX_QUEUED_STEPS = 4096
+
+# Maximum number of queued intermediate steps turned into spans in one pass of the background task
+_MAX_STEP_BATCH_SIZE = 64
+
+# Maximum time, in seconds, spent turning the remaining intermediate steps into spans after the listener stops. This
+# happens in a detached task, so it does not delay the workflow result.
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+# Detached tasks finishing the spans of runs which have ended. The event loop only keeps weak references to tasks, so
+# they are held here until they are done.
+_FINISH_TASKS: set[asyncio.Task] = set()
+
+# TypeAdapters used to serialize span payloads, keyed by payload type. Building an adapter compiles a pydantic-core
+# schema, so they are built once per type. `None` marks types pydantic cannot build an adapter for.
+_PAYLOAD_TYPE_ADAPTERS: dict[type, TypeAdapter | None] = {}
+
+# Scalar payload types which are serialized directly without going through pydantic
+_JSON_SCALAR_TYPES = frozenset((int, float, bool, type(None)))
+
+_NS_PER_SECOND = 1_000_000_000
+
+_HUMAN_QUESTION_RE = re.compile(r"Human:\s*Question:\s*(.*)")
+
+_EVENT_TYPE_TO_SPAN_KIND: dict[IntermediateStepType, str] = {
+    IntermediateStepType.LLM_START: OpenInferenceSpanKindValues.LLM.value,
+    IntermediateStepType.LLM_END: OpenInferenceSpanKindValues.LLM.value,
+    IntermediateStepType.LLM_NEW_TOKEN: OpenInferenceSpanKindValues.LLM.value,
+    IntermediateStepType.TOOL_START: OpenInferenceSpanKindValues.TOOL.value,
+    IntermediateStepType.TOOL_END: OpenInferenceSpanKindValues.TOOL.value,
+    IntermediateStepType.FUNCTION_START: OpenInferenceSpanKindValues.CHAIN.value,
+    IntermediateStepType.FUNCTION_END: OpenInferenceSpanKindValues.CHAIN.value,
+}
+
 
 def _ns_timestamp(seconds_float: float) -> int:
     """
     Convert AgentIQ’s float `event_timestamp` (in seconds) into an integer number
     of nanoseconds, as OpenTelemetry expects.
     """
-    return int(seconds_float * 1e9)
+    return int(seconds_float * _NS_PER_SECOND)
 
 
 class AsyncOtelSpanListener:
@@ -56,24 +107,55 @@ class AsyncOtelSpanListener:
     the workflow is not blocking or entangled by OTel calls.
     """
 
-    def __init__(self, context_state: AIQContextState | None = None):
+    __slots__ = ("_context_state",
+                 "_subscription",
+                 "_span_stack",
+                 "_running",
+                 "_loop",
+                 "_queue",
+                 "_held_steps",
+                 "_worker",
+                 "_dropped_steps",
+                 "_enabled",
+                 "_trace_sampling",
+                 "_tracer")
+
+    def __init__(self,
+                 context_state: AIQContextState | None = None,
+                 enabled: bool = True,
+                 trace_sampling: TraceSamplingConfig | None = None):
         """
         :param context_state: Optionally supply a specific AIQContextState.
                               If None, uses the global singleton.
+        :param enabled: Whether to create spans at all. Pass False when no
+                        exporters are configured, the spans would be discarded.
+        :param trace_sampling: Optional tail-based sampling settings. When
+                               enabled, spans are only created once the run
+                               has finished and the trace is kept.
         """
         self._context_state = context_state or AIQContextState.get()
+        self._enabled = enabled
+        self._trace_sampling = trace_sampling
 
         # Maintain a subscription so we can unsubscribe on shutdown
         self._subscription = None
 
-        # Outstanding spans which have been opened but not yet closed
-        self._outstanding_spans: dict[str, Span] = {}
-
-        # Stack of spans, for when we need to create a child span
-        self._span_stack: list[Span] = []
+        # Stack of (step UUID, span) for spans which have been opened but not yet closed. The top of the stack is the
+        # parent of the next child span.
+        self._span_stack: list[tuple[str, Span]] = []
 
         self._running = False
 
+        # Intermediate steps are queued by `_on_next` and turned into spans by a background task
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[IntermediateStep | None] | None = None
+        self._worker: asyncio.Task | None = None
+        self._dropped_steps = 0
+
+        # With tail-based sampling the steps of the run are held here until the sampling decision is made. This is not
+        # bounded like the queue, dropping steps would leave spans which are started but never ended.
+        self._held_steps: list[IntermediateStep] | None = None
+
         # Prepare the tracer (optionally you might already have done this)
         if trace.get_tracer_provider() is None or not isinstance(trace.get_tracer_provider(), TracerProvider):
             tracer_provider = TracerProvider()
@@ -86,15 +168,92 @@ class AsyncOtelSpanListener:
 
     def _on_next(self, step: IntermediateStep) -> None:
         """
-        The main logic that reacts to each IntermediateStep.
+        Reacts to each IntermediateStep by handing it off to the background task, keeping span creation off the
+        workflow's event path. Steps can be pushed from thread pool threads, so those are handed to the event loop.
         """
-        if (step.event_state == IntermediateStepState.START):
+        event_state = step.event_state
+        if (event_state is not IntermediateStepState.START and event_state is not IntermediateStepState.END):
+            return
 
-            self._process_start_event(step)
+        loop = self._loop
+        if (loop is None):
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if (running_loop is loop):
+            self._enqueue_step(step)
+        else:
+            loop.call_soon_threadsafe(self._enqueue_step, step)
+
+    def _enqueue_step(self, step: IntermediateStep) -> None:
+        held_steps = self._held_steps
+        if (held_steps is not None):
+            held_steps.append(step)
+            return
+
+        try:
+            self._queue.put_nowait(step)
+        except asyncio.QueueFull:
+            if (self._dropped_steps == 0):
+                logger.warning("Span queue is full. Dropping intermediate steps until the queue drains.")
+
+            self._dropped_steps += 1
+
+    def _process_steps(self, steps: list[IntermediateStep]) -> None:
+        """
+        The main logic that reacts to a batch of IntermediateSteps.
+        """
+        process_start_event = self._process_start_event
+        process_end_event = self._process_end_event
 
-        elif (step.event_state == IntermediateStepState.END):
+        for step in steps:
+            try:
+                if (step.event_state is IntermediateStepState.START):
 
-            self._process_end_event(step)
+                    process_start_event(step)
+
+                else:
+
+                    process_end_event(step)
+
+            except Exception:
+                logger.exception("Error creating span for intermediate step %s", step.UUID)
+
+    async def _process_queued_steps(self) -> None:
+        """
+        Background task which turns queued intermediate steps into spans until the `None` sentinel is received. Steps
+        which queued up while the task was busy are handled together as one batch.
+        """
+        queue = self._queue
+
+        while True:
+            step = await queue.get()
+            steps = []
+
+            while (step is not None):
+                steps.append(step)
+
+                if (len(steps) >= _MAX_STEP_BATCH_SIZE or queue.empty()):
+                    break
+
+                step = queue.get_nowait()
+
+            self._process_steps(steps)
+
+            if (step is None):
+                return
+
+    async def _process_held_steps(self, steps: list[IntermediateStep]) -> None:
+        """
+        Turns the steps held back for tail-based sampling into spans, in batches so other tasks can run in between.
+        """
+        for i in range(0, len(steps), _MAX_STEP_BATCH_SIZE):
+            self._process_steps(steps[i:i + _MAX_STEP_BATCH_SIZE])
+            await asyncio.sleep(0)
 
     def _on_error(self, exc: Exception) -> None:
         logger.error("Error in intermediate step subscription: %s", exc, exc_info=True)
@@ -113,9 +272,34 @@ class AsyncOtelSpanListener:
                 ...
             # cleans up
 
-        This sets up the subscription to the AgentIQ event stream and starts the background loop.
+        This sets up the subscription to the AgentIQ event stream and starts the background loop. If the listener is not
+        enabled, no subscription is made at all.
+
+        With tail-based sampling enabled, intermediate steps are held back until the workflow finishes and are then
+        either turned into spans or discarded, depending on the outcome of the run.
+
+        Steps which have not been turned into spans when the workflow finishes are handled by a detached task, so spans
+        may still be ending shortly after the context manager exits.
         """
+        if (not self._enabled):
+            logger.debug("Tracing is not enabled. Skipping span creation.")
+            yield
+            return
+
+        tail_sampling = self._trace_sampling is not None and self._trace_sampling.is_enabled
+        start_time = time.monotonic()
+        failed = False
+
         try:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=_MAX_QUEUED_STEPS)
+            self._dropped_steps = 0
+
+            if (tail_sampling):
+                self._held_steps = []
+            else:
+                self._worker = asyncio.create_task(self._process_queued_steps())
+
             # Subscribe to the event stream
             subject = self._context_state.event_stream.get()
             self._subscription = subject.subscribe(
@@ -128,34 +312,88 @@ class AsyncOtelSpanListener:
 
             yield  # let the caller do their workflow
 
+        except BaseException:
+            failed = True
+            raise
+
         finally:
             # Cleanup
             self._running = False
-            # Close out any running spans
-            await self._cleanup()
 
+            # The run is over, no further steps are needed from the event stream
             if self._subscription:
                 self._subscription.unsubscribe()
             self._subscription = None
 
-    async def _cleanup(self):
+            held_steps = self._held_steps
+            self._held_steps = None
+
+            # Now that the outcome of the run is known, either create the spans for the held back steps or drop them
+            if (held_steps is not None and not self._should_export_trace(failed, time.monotonic() - start_time)):
+                held_steps = None
+
+            worker = self._worker
+            self._worker = None
+
+            # Finishing the spans is handed off to a detached task, so a backlog of steps does not delay the workflow
+            # result
+            finish_task = asyncio.create_task(self._finish(worker, held_steps))
+            _FINISH_TASKS.add(finish_task)
+            finish_task.add_done_callback(_FINISH_TASKS.discard)
+
+    async def _finish(self, worker: asyncio.Task | None, held_steps: list[IntermediateStep] | None) -> None:
         """
-        Close any remaining open spans.
+        Turns the steps remaining at the end of the run into spans, then closes out any spans which are still open. The
+        wait for the remaining steps is bounded; whatever is left after the timeout is dropped.
         """
-        if self._outstanding_spans:
-            logger.warning(
-                "Not all spans were closed. Ensure all start events have a corresponding end event. Remaining: %s",
-                self._outstanding_spans)
+        try:
+            if (worker is not None):
+                # Stop the background task once it has finished the steps queued so far
+                await self._queue.put(None)
+                remaining_steps = worker
+            elif (held_steps is not None):
+                remaining_steps = self._process_held_steps(held_steps)
+            else:
+                remaining_steps = None
+
+            if (remaining_steps is not None):
+                try:
+                    await asyncio.wait_for(remaining_steps, timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+                except TimeoutError:
+                    logger.warning("Timed out after %s seconds creating spans. Dropping the remaining steps",
+                                   _SHUTDOWN_TIMEOUT_SECONDS)
+
+            if (self._dropped_steps > 0):
+                logger.warning("Dropped %d intermediate steps because the span queue was full", self._dropped_steps)
+
+        finally:
+            # Close out any running spans
+            await self._cleanup()
 
-        for span_info in self._outstanding_spans.values():
-            span_info.end()
+    def _should_export_trace(self, failed: bool, duration: float) -> bool:
+        """
+        Tail-based sampling decision for a finished run. Failed and slow runs are always kept.
+        """
+        if (failed):
+            return True
+
+        slow_trace_threshold = self._trace_sampling.slow_trace_threshold
+        if (slow_trace_threshold is not None and duration > slow_trace_threshold):
+            return True
 
-        self._outstanding_spans.clear()
+        return random.random() < self._trace_sampling.sample_ratio
 
+    async def _cleanup(self):
+        """
+        Close any remaining open spans.
+        """
         if self._span_stack:
-            logger.error(
+            logger.warning(
                 "Not all spans were closed. Ensure all start events have a corresponding end event. Remaining: %s",
-                self._span_stack)
+                dict(self._span_stack))
+
+        for _, span in self._span_stack:
+            span.end()
 
         self._span_stack.clear()
 
@@ -164,18 +402,43 @@ class AsyncOtelSpanListener:
         Serialize the input value to a string. Returns a tuple with the serialized value and a boolean indicating if the
         serialization is JSON or a string
         """
+        input_type = type(input_value)
+
+        # Fast paths for the common scalar payloads
+        if (input_type is str):
+            return input_value, False
+
+        if (input_type in _JSON_SCALAR_TYPES):
+            return json.dumps(input_value), True
+
+        if (input_type is bytes or input_type is bytearray):
+            return input_value.decode('utf-8', errors='replace'), False
+
         try:
-            return TypeAdapter(type(input_value)).dump_json(input_value).decode('utf-8'), True
-        except Exception:
-            # Fallback to string representation if we can't serialize using pydantic
-            return str(input_value), False
+            adapter = _PAYLOAD_TYPE_ADAPTERS[input_type]
+        except KeyError:
+            try:
+                adapter = TypeAdapter(input_type)
+            except Exception:
+                adapter = None
+
+            _PAYLOAD_TYPE_ADAPTERS[input_type] = adapter
+
+        if (adapter is not None):
+            try:
+                return adapter.dump_json(input_value, warnings=False).decode('utf-8'), True
+            except Exception:
+                pass
+
+        # Fallback to string representation if we can't serialize using pydantic
+        return str(input_value), False
 
     def _process_start_event(self, step: IntermediateStep):
 
         parent_ctx = None
 
         if (len(self._span_stack) > 0):
-            parent_span = self._span_stack[-1]
+            _, parent_span = self._span_stack[-1]
 
             parent_ctx = set_span_in_context(parent_span)
 
@@ -191,78 +454,78 @@ class AsyncOtelSpanListener:
         else:
             sub_span_name = f"{step.payload.event_type}"
 
-        # Start the subspan
-        sub_span = self._tracer.start_span(
-            name=sub_span_name,
-            context=parent_ctx,
-            attributes={
-                "aiq.event_type": step.payload.event_type.value,
-                "aiq.function.id": step.function_ancestry.function_id,
-                "aiq.function.name": step.function_ancestry.function_name,
-                "aiq.subspan.name": step.payload.name or "",
-                "aiq.event_timestamp": step.event_timestamp,
-                "aiq.framework": step.payload.framework.value if step.payload.framework else "unknown",
-            },
-            start_time=start_ns,
-        )
-
-        event_type_to_span_kind = {
-            "LLM_START": OpenInferenceSpanKindValues.LLM,
-            "LLM_END": OpenInferenceSpanKindValues.LLM,
-            "LLM_NEW_TOKEN": OpenInferenceSpanKindValues.LLM,
-            "TOOL_START": OpenInferenceSpanKindValues.TOOL,
-            "TOOL_END": OpenInferenceSpanKindValues.TOOL,
-            "FUNCTION_START": OpenInferenceSpanKindValues.CHAIN,
-            "FUNCTION_END": OpenInferenceSpanKindValues.CHAIN,
+        framework = step.payload.framework
+        span_kind = _EVENT_TYPE_TO_SPAN_KIND.get(step.event_type, OpenInferenceSpanKindValues.UNKNOWN.value)
+
+        attributes = {
+            "aiq.event_type": step.payload.event_type.value,
+            "aiq.function.id": step.function_ancestry.function_id,
+            "aiq.function.name": step.function_ancestry.function_name,
+            "aiq.subspan.name": step.payload.name or "",
+            "aiq.event_timestamp": step.event_timestamp,
+            "aiq.framework": framework.value if framework else "unknown",
+            OPENINFERENCE_SPAN_KIND: span_kind,
         }
 
-        span_kind = event_type_to_span_kind.get(step.event_type, OpenInferenceSpanKindValues.UNKNOWN)
-        sub_span.set_attribute(SpanAttributes.OPENINFERENCE_SPAN_KIND, span_kind.value)
-
         if step.payload.data and step.payload.data.input:
-            # optional parse
-            match = re.search(r"Human:\s*Question:\s*(.*)", str(step.payload.data.input))
+            step_input = step.payload.data.input
+
+            # optional parse. Only string prompts can contain the human question, so structured inputs are not
+            # stringified just to search them
+            match = _HUMAN_QUESTION_RE.search(step_input) if isinstance(step_input, str) else None
             if match:
                 human_question = match.group(1).strip()
-                sub_span.set_attribute(SpanAttributes.INPUT_VALUE, human_question)
+                attributes[_INPUT_VALUE] = human_question
             else:
-                serialized_input, is_json = self._serialize_payload(step.payload.data.input)
-                sub_span.set_attribute(SpanAttributes.INPUT_VALUE, serialized_input)
-                sub_span.set_attribute(SpanAttributes.INPUT_MIME_TYPE, "application/json" if is_json else "text/plain")
+                serialized_input, is_json = self._serialize_payload(step_input)
+                attributes[_INPUT_VALUE] = serialized_input
+                attributes[_INPUT_MIME_TYPE] = "application/json" if is_json else "text/plain"
 
-        self._span_stack.append(sub_span)
+        # Start the subspan with all of its attributes at once
+        sub_span = self._tracer.start_span(
+            name=sub_span_name,
+            context=parent_ctx,
+            attributes=attributes,
+            start_time=start_ns,
+        )
 
-        self._outstanding_spans[step.UUID] = sub_span
+        self._span_stack.append((step.UUID, sub_span))
 
     def _process_end_event(self, step: IntermediateStep):
 
-        # Find the subspan that was created in the start event
-        sub_span = self._outstanding_spans.pop(step.UUID, None)
-
-        if sub_span is None:
-            logger.warning("No subspan found for step %s", step.UUID)
-            return
-
-        self._span_stack.pop()
+        # Find the subspan that was created in the start event. Spans almost always end in LIFO order, so check the
+        # top of the stack before searching the rest of it
+        if (self._span_stack and self._span_stack[-1][0] == step.UUID):
+            _, sub_span = self._span_stack.pop()
+        else:
+            for index in range(len(self._span_stack) - 1, -1, -1):
+                if (self._span_stack[index][0] == step.UUID):
+                    _, sub_span = self._span_stack.pop(index)
+                    break
+            else:
+                logger.warning("No subspan found for step %s", step.UUID)
+                return
 
         # Optionally add more attributes from usage_info or data
+        attributes = {}
+
         usage_info = step.payload.usage_info
         if usage_info:
-            sub_span.set_attribute("aiq.usage.num_llm_calls",
-                                   usage_info.num_llm_calls if usage_info.num_llm_calls else 0)
-            sub_span.set_attribute("aiq.usage.seconds_between_calls",
-                                   usage_info.seconds_between_calls if usage_info.seconds_between_calls else 0)
-            sub_span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_PROMPT,
-                                   usage_info.token_usage.prompt_tokens if usage_info.token_usage else 0)
-            sub_span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_COMPLETION,
-                                   usage_info.token_usage.completion_tokens if usage_info.token_usage else 0)
-            sub_span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_TOTAL,
-                                   usage_info.token_usage.total_tokens if usage_info.token_usage else 0)
+            token_usage = usage_info.token_usage
+            attributes["aiq.usage.num_llm_calls"] = usage_info.num_llm_calls if usage_info.num_llm_calls else 0
+            attributes["aiq.usage.seconds_between_calls"] = (usage_info.seconds_between_calls
+                                                             if usage_info.seconds_between_calls else 0)
+            attributes[_LLM_TOKEN_COUNT_PROMPT] = token_usage.prompt_tokens if token_usage else 0
+            attributes[_LLM_TOKEN_COUNT_COMPLETION] = token_usage.completion_tokens if token_usage else 0
+            attributes[_LLM_TOKEN_COUNT_TOTAL] = token_usage.total_tokens if token_usage else 0
 
         if step.payload.data and step.payload.data.output is not None:
             serialized_output, is_json = self._serialize_payload(step.payload.data.output)
-            sub_span.set_attribute(SpanAttributes.OUTPUT_VALUE, serialized_output)
-            sub_span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE, "application/json" if is_json else "text/plain")
+            attributes[_OUTPUT_VALUE] = serialized_output
+            attributes[_OUTPUT_MIME_TYPE] = "application/json" if is_json else "text/plain"
+
+        if attributes:
+            sub_span.set_attributes(attributes)
 
         end_ns = _ns_timestamp(step.payload.event_timestamp)
 
@@ -52,14 +52,34 @@ class OtelCollectorTelemetryExporter(TelemetryExporterBaseConfig, name="otelcoll
 
     endpoint: str = Field(description="The otel endpoint to export telemetry traces.")
     project: str = Field(description="The project name to group the telemetry traces.")
+    max_queue_size: int = Field(default=4096,
+                                gt=0,
+                                description="The maximum number of spans buffered before new spans are dropped.")
+    schedule_delay_millis: int = Field(default=1000, gt=0, description="The delay between two consecutive exports.")
+    max_export_batch_size: int = Field(default=256, gt=0, description="The maximum number of spans in one export.")
+    export_timeout_millis: int = Field(default=10000,
+                                       gt=0,
+                                       description="How long an export can run before it is cancelled.")
+    gzip: bool = Field(default=True, description="Whether to gzip compress the exported spans.")
 
 
 @register_telemetry_exporter(config_type=OtelCollectorTelemetryExporter)
 async def otel_telemetry_exporter(config: OtelCollectorTelemetryExporter, builder: Builder):
 
+    from grpc import Compression
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-
-    yield OTLPSpanExporter(endpoint=config.endpoint)
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    exporter = OTLPSpanExporter(endpoint=config.endpoint,
+                                compression=Compression.Gzip if config.gzip else Compression.NoCompression)
+
+    # Use a batch processor sized for bursty agent workloads, so spans are not dropped when many steps finish at once.
+    # For higher throughput, configure several otelcollector exporters, each gets its own processor and export thread.
+    yield BatchSpanProcessor(exporter,
+                             max_queue_size=config.max_queue_size,
+                             schedule_delay_millis=config.schedule_delay_millis,
+                             max_export_batch_size=config.max_export_batch_size,
+                             export_timeout_millis=config.export_timeout_millis)
 
 
 class ConsoleLoggingMethod(LoggingBaseConfig, name="console"):
@@ -16,6 +16,7 @@
 # forecasting/models/linear_model.py
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from aiq.profiler.forecasting.models.forecasting_base_model import ForecastingBaseModel
 import logging
 from aiq.data_models.intermediate_step import IntermediateStep
@@ -91,16 +92,10 @@ class RandomForestModel(ForecastingBaseModel):
 
         self.matrix_length = matrix_length
 
-        samples = self._preprocess_for_forecasting(raw_matrices, matrix_length, matrix_length)
-
-        x_list = []
-        y_list = []
-        for (x_mat, y_mat) in samples:
-            x_list.append(x_mat)
-            y_list.append(y_mat)
+        x_windows, y_windows = self._preprocess_for_forecasting(raw_matrices, matrix_length, matrix_length)
 
         # 2) Flatten features
-        x_flat, y_flat = self._flatten_features(x_list, y_list)
+        x_flat, y_flat = self._flatten_features(x_windows, y_windows)
 
         return x_flat, y_flat
 
@@ -109,7 +104,7 @@ class RandomForestModel(ForecastingBaseModel):
         arrays: list[np.ndarray],
         n: int = 3,
         k: int = 3,
-    ) -> list[tuple[np.ndarray, np.ndarray]]:
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Preprocess a list of arrays where each array has shape (T, 3),
         with columns:
@@ -126,6 +121,10 @@ class RandomForestModel(ForecastingBaseModel):
           Y: shape (k, 3)
              -> The next k calls after row i (padded if needed).
 
+        The windows for all rows of an array are built at once as strided
+        views over a zero-padded copy of the array, rather than one row at
+        a time.
+
         Parameters
         ----------
         arrays : list of np.ndarray
@@ -137,79 +136,53 @@ class RandomForestModel(ForecastingBaseModel):
 
         Returns
         -------
-        samples : list of (X, Y) tuples
-            Each X has shape (n, 3), each Y has shape (k, 3).
+        x_windows : np.ndarray
+            Shape (N, n, 3), where N is the total number of rows across all arrays
+            with at least n rows.
+        y_windows : np.ndarray
+            Shape (N, k, 3).
         """
 
-        samples = []
+        x_blocks = []
+        y_blocks = []
 
         for arr in arrays:
             t = arr.shape[0]
 
+            # Runs with fewer than n LLM calls (including runs with none, whose array is empty) cannot fill a
+            # context window, skip them
+            if (t < n):
+                continue
+
             # Safety check (optional)
             if arr.shape[1] != 3:
                 raise ValueError("Each array must have exactly 3 columns.")
 
-            for i in range(t):
-                # --- 1) Build X: the context window for rows [i-n+1 .. i] ---
-
-                # The 'start_idx' is the first row in the n-window
-                start_idx = i - n + 1
-                if start_idx < 0:
-                    # we need padding at the top
-                    pad_size = -start_idx
-                    # create a zero block for that portion
-                    pad_block = np.zeros((pad_size, 3), dtype=arr.dtype)
-                    # portion of the real data we actually have
-                    real_block = arr[:i + 1, :].copy()  # up to row i inclusive
-
-                    # Concatenate
-                    x_mat = np.vstack([pad_block, real_block])
-                else:
-                    # we have enough rows, just slice
-                    x_mat = arr[start_idx:i + 1, :].copy()
-
-                # Now X_mat is shape (<= n, 3). If it's < n, we've padded.
-                # If it's exactly n, fine. If it's bigger (shouldn't be), we slice again:
-                if x_mat.shape[0] > n:
-                    x_mat = x_mat[-n:, :]
-
-                # For the "current" row in X_mat (the last row in that slice),
-                # we zero-out the output_prompt_tokens column:
-                # This simulates "unknown" output for the current call.
-                x_mat[-1, 2] = 0
-
-                # If it's still shorter than n, do final padding from the top:
-                if x_mat.shape[0] < n:
-                    missing = n - x_mat.shape[0]
-                    pad_block2 = np.zeros((missing, 3), dtype=arr.dtype)
-                    x_mat = np.vstack([pad_block2, x_mat])
-
-                # Ensure shape is exactly (n, 3)
-                assert x_mat.shape == (n, 3), f"Expected (n,3), got {x_mat.shape}"
-
-                # --- 2) Build Y: the next k calls i+1 .. i+k ---
-                end_idx = i + k
-                if end_idx > t - 1:
-                    # if we go beyond the last row, we pad
-                    real_portion = arr[i + 1:t, :].copy()  # might be empty if i == T-1
-                    pad_needed = k - real_portion.shape[0]
-                    if pad_needed > 0:
-                        pad_block = np.zeros((pad_needed, 3), dtype=arr.dtype)
-                        y_mat = np.vstack([real_portion, pad_block])
-                    else:
-                        y_mat = real_portion
-                else:
-                    # we have enough future rows
-                    y_mat = arr[i + 1:i + 1 + k, :].copy()
-
-                # Ensure shape is exactly (k, 3)
-                assert y_mat.shape == (k, 3), f"Expected (k,3), got {y_mat.shape}"
-
-                # 3) Collect the (X, Y) pair
-                samples.append((x_mat, y_mat))
-
-        return samples
+            # --- 1) Build X: the context windows for rows [i-n+1 .. i] ---
+            # Pad n-1 zero rows at the top so that the window ending at row i starts at row i of the padded array
+            x_padded = np.vstack([np.zeros((n - 1, 3), dtype=arr.dtype), arr])
+
+            # sliding_window_view yields shape (T, 3, n), move the window axis before the columns
+            x_mat = sliding_window_view(x_padded, n, axis=0).transpose(0, 2, 1).copy()
+
+            # For the "current" row of each window, zero-out the output_prompt_tokens column:
+            # This simulates "unknown" output for the current call.
+            x_mat[:, -1, 2] = 0
+
+            # --- 2) Build Y: the next k calls i+1 .. i+k ---
+            # Pad k zero rows at the bottom so the windows past the last row are zero filled
+            y_padded = np.vstack([arr, np.zeros((k, 3), dtype=arr.dtype)])
+
+            # Windows start at row i+1, so skip the first one
+            y_mat = sliding_window_view(y_padded, k, axis=0)[1:t + 1].transpose(0, 2, 1)
+
+            x_blocks.append(x_mat)
+            y_blocks.append(y_mat)
+
+        if not x_blocks:
+            return np.empty((0, n, 3)), np.empty((0, k, 3))
+
+        return np.concatenate(x_blocks), np.concatenate(y_blocks)
 
     def _extract_token_usage_meta(self, all_requests_data: list[list[IntermediateStep]]):
 
@@ -242,24 +215,15 @@ class RandomForestModel(ForecastingBaseModel):
 
         return all_run_data, recommended_matrix_length
 
-    def _flatten_features(self, x_list, y_list):
+    def _flatten_features(self, x_windows, y_windows):
         """
-        X_list: list of arrays, each of shape (matrix_length, 4)
-        y_list: list of arrays, each of shape (1, 4)
+        x_windows: array of shape (N, matrix_length, 3)
+        y_windows: array of shape (N, k, 3)
 
         Returns:
-            X_flat: np.array of shape (N, matrix_length*4)
-            y_flat: np.array of shape (N, 4)
+            X_flat: np.array of shape (N, matrix_length*3)
+            y_flat: np.array of shape (N, k*3)
         """
-        flattened_x = []
-        flattened_y = []
-
-        for x_mat, y_mat in zip(x_list, y_list):
-            x_1d = x_mat.flatten()  # shape -> (matrix_length*4,)
-            y_1d = y_mat.flatten()  # shape -> (4,)
-            flattened_x.append(x_1d)
-            flattened_y.append(y_1d)
-
-        x_flat = np.array(flattened_x)
-        y_flat = np.array(flattened_y)
+        x_flat = x_windows.reshape(x_windows.shape[0], -1)
+        y_flat = y_windows.reshape(y_windows.shape[0], -1)
         return x_flat, y_flat
@@ -29,6 +29,7 @@ from aiq.registry_handlers.schemas.remove import RemoveResponse
 from aiq.registry_handlers.schemas.search import SearchFields
 from aiq.registry_handlers.schemas.search import SearchQuery
 from aiq.registry_handlers.schemas.search import SearchResponse
+from aiq.registry_handlers.schemas.search import SearchResponseItem
 from aiq.registry_handlers.schemas.status import ActionEnum
 from aiq.registry_handlers.schemas.status import StatusEnum
 
@@ -116,7 +117,13 @@ class LocalRegistryHandler(AbstractRegistryHandler):
             else:
                 top_k = len(matched_results)
 
-            validated_search_response = SearchResponse(results=matched_results[:top_k],
+            # The results come straight from the discovery metadata of the registered components, so they are already
+            # valid and can skip per-item validation
+            search_results = [
+                SearchResponseItem.model_construct(**component_result) for component_result in matched_results[:top_k]
+            ]
+
+            validated_search_response = SearchResponse(results=search_results,
                                                        params=query,
                                                        status={
                                                            "status": StatusEnum.SUCCESS,
@@ -16,12 +16,17 @@
 from __future__ import annotations
 
 import importlib.metadata
+import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from enum import IntFlag
 from enum import auto
-from functools import reduce
+from functools import lru_cache
+from itertools import chain
 
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.cli.type_registry import GlobalTypeRegistry
@@ -34,6 +39,12 @@ from aiq.utils.type_utils import StrPath
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of threads used to import plugins when parallel import is enabled
+_MAX_IMPORT_WORKERS = 8
+
+# Number of validated configuration files kept by `load_config`
+_CONFIG_CACHE_SIZE = 32
+
 
 class PluginTypes(IntFlag):
     COMPONENT = auto()
@@ -61,11 +72,20 @@ class PluginTypes(IntFlag):
     """
 
 
+# Plugin types which have already been discovered and registered by `discover_and_register_plugins`
+_loaded_plugin_types = PluginTypes(0)
+_loaded_plugin_types_lock = threading.Lock()
+
+
 def load_config(config_file: StrPath) -> AIQConfig:
     """
     This is the primary entry point for loading an AgentIQ configuration file. It ensures that all plugins are loaded
     and then validates the configuration file against the AIQConfig schema.
 
+    Validated configurations are cached by absolute path, modification time (in nanoseconds) and file size, so loading
+    an unchanged file again skips the YAML parsing and schema validation. Each call returns a deep copy of the cached
+    configuration, which the caller is free to modify.
+
     Parameters
     ----------
     config_file : StrPath
@@ -80,10 +100,49 @@ def load_config(config_file: StrPath) -> AIQConfig:
     # Ensure all of the plugins are loaded
     discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
 
-    config_yaml = yaml_load(config_file)
+    config_path = os.path.abspath(config_file)
+
+    stat_result = os.stat(config_path)
+    validated_aiq_config = _load_config_cached(config_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+    # Hand out a copy so that callers modifying the config do not affect the cached instance
+    return validated_aiq_config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> AIQConfig:  # pylint: disable=unused-argument
+    """
+    Parse and validate a configuration file. The modification time and size are only part of the cache key so that
+    edited files are reloaded.
+    """
+
+    config_yaml = yaml_load(config_path)
+
+    # Validate configuration adheres to AgentIQ schemas
+    return validate_schema(config_yaml, AIQConfig)
+
+
+def load_config_json(config_json: str) -> AIQConfig:
+    """
+    Load an AgentIQ configuration from a JSON string, such as one produced by `AIQConfig.model_dump_json`. Like
+    `load_config`, this ensures that all plugins are loaded before validating against the AIQConfig schema.
+
+    Parameters
+    ----------
+    config_json : str
+        The JSON encoded configuration
+
+    Returns
+    -------
+    AIQConfig
+        The validated AIQConfig object
+    """
+
+    # Ensure all of the plugins are loaded
+    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
 
     # Validate configuration adheres to AgentIQ schemas
-    validated_aiq_config = validate_schema(config_yaml, AIQConfig)
+    validated_aiq_config = validate_schema(json.loads(config_json), AIQConfig)
 
     return validated_aiq_config
 
@@ -117,8 +176,6 @@ def discover_entrypoints(plugin_type: PluginTypes):
     Discover all the requested plugin types which were registered via an entry point group and return them.
     """
 
-    entry_points = importlib.metadata.entry_points()
-
     plugin_groups = []
 
     # Add the specified plugin type to the list of groups to load
@@ -131,58 +188,116 @@ def discover_entrypoints(plugin_type: PluginTypes):
     if (plugin_type & PluginTypes.EVALUATOR):
         plugin_groups.append("aiq.evaluators")
 
-    # Get the entry points for the specified groups
-    aiq_plugins = reduce(lambda x, y: x + y, [entry_points.select(group=y) for y in plugin_groups])
+    # Get the entry points for the specified groups in a single pass over the installed entry points, keeping them
+    # ordered by group
+    group_entry_points: dict[str, list[importlib.metadata.EntryPoint]] = {group: [] for group in plugin_groups}
+
+    for entry_point in importlib.metadata.entry_points():
+        group_list = group_entry_points.get(entry_point.group)
+
+        if (group_list is not None):
+            group_list.append(entry_point)
+
+    aiq_plugins = list(chain.from_iterable(group_entry_points.values()))
 
     return aiq_plugins
 
 
+def _load_entry_point(entry_point: importlib.metadata.EntryPoint) -> float | None:
+    """
+    Load a single plugin entry point, returning the time it took in milliseconds or `None` if loading failed.
+    """
+
+    try:
+        logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+
+        start_time = time.time()
+
+        entry_point.load()
+
+        elapsed_time = (time.time() - start_time) * 1000
+
+        logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
+                     entry_point.module,
+                     entry_point.name,
+                     elapsed_time)
+
+        return elapsed_time
+
+    except ImportError:
+        logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
+        # Optionally, you can mark the plugin as unavailable or take other actions
+
+    except Exception:
+        logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+
+    return None
+
+
 def discover_and_register_plugins(plugin_type: PluginTypes):
     """
     Discover all the requested plugin types which were registered via an entry point group and register them into the
     GlobalTypeRegistry.
+
+    Plugins are imported one at a time by default. Set the `AIQ_PARALLEL_PLUGIN_IMPORT=1` environment variable to
+    import them concurrently using a thread pool, which is only safe when the plugins do not import each other. Plugin
+    types which have already been loaded are skipped, so repeated calls are cheap.
     """
 
-    # Get the entry points for the specified groups
-    aiq_plugins = discover_entrypoints(plugin_type)
+    global _loaded_plugin_types  # pylint: disable=global-statement
 
-    count = 0
+    with _loaded_plugin_types_lock:
 
-    # Pause registration hooks for performance. This is useful when loading a large number of plugins.
-    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+        plugin_type = plugin_type & ~_loaded_plugin_types
 
-        for entry_point in aiq_plugins:
-            try:
-                logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+        if (not plugin_type):
+            return
 
-                start_time = time.time()
+        _register_plugins(plugin_type)
 
-                entry_point.load()
+        _loaded_plugin_types |= plugin_type
 
-                elapsed_time = (time.time() - start_time) * 1000
 
-                logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
-                             entry_point.module,
-                             entry_point.name,
-                             elapsed_time)
+def _register_plugins(plugin_type: PluginTypes):
 
-                # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
-                # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
-                # if a debugger is attached.
-                if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
-                    logger.warning(
-                        "Loading module '%s' from entry point '%s' took a long time (%f ms). "
-                        "Ensure all imports are inside your registered functions.",
-                        entry_point.module,
-                        entry_point.name,
-                        elapsed_time)
+    # Get the entry points for the specified groups
+    aiq_plugins = discover_entrypoints(plugin_type)
 
-            except ImportError:
-                logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
-                # Optionally, you can mark the plugin as unavailable or take other actions
+    if (len(aiq_plugins) == 0):
+        return
 
-            except Exception:
-                logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+    # Plugins are imported one at a time by default. Plugin packages import each other and shared modules, which can
+    # deadlock or fail with partially initialized modules when imported from several threads at once, so importing in
+    # parallel is opt-in for environments where the plugins are known to be independent.
+    parallel_import = os.getenv("AIQ_PARALLEL_PLUGIN_IMPORT", "0") == "1"
+
+    count = 0
+
+    # Pause registration hooks for performance. This is useful when loading a large number of plugins.
+    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
 
-            finally:
-                count += 1
+        if (parallel_import):
+            executor = ThreadPoolExecutor(max_workers=min(_MAX_IMPORT_WORKERS, len(aiq_plugins)),
+                                          thread_name_prefix="aiq_plugin_loader")
+            with executor:
+                # Each import is timed on the thread which runs it. Results are kept in discovery order so the
+                # slow import thresholds below apply the same way as for serial imports.
+                results = list(zip(aiq_plugins, executor.map(_load_entry_point, aiq_plugins)))
+        else:
+            results = ((entry_point, _load_entry_point(entry_point)) for entry_point in aiq_plugins)
+
+        for entry_point, elapsed_time in results:
+
+            # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
+            # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
+            # if a debugger is attached.
+            if (elapsed_time is not None
+                    and elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
+                logger.warning(
+                    "Loading module '%s' from entry point '%s' took a long time (%f ms). "
+                    "Ensure all imports are inside your registered functions.",
+                    entry_point.module,
+                    entry_point.name,
+                    elapsed_time)
+
+            count += 1
@@ -15,11 +15,14 @@
 
 import logging
 import typing
+from contextlib import AbstractAsyncContextManager
+from contextlib import nullcontext
 from enum import Enum
 
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.function import Function
+from aiq.data_models.config import TraceSamplingConfig
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.observability.async_otel_listener import AsyncOtelSpanListener
 from aiq.utils.reactive.subject import Subject
@@ -41,10 +44,19 @@ class AIQRunnerState(Enum):
 
 _T = typing.TypeVar("_T")
 
+# The root of every invocation graph. It is never mutated, so a single instance is shared by all runs
+_ROOT_INVOCATION_NODE = InvocationNode(function_name="root", function_id="root")
+
 
 class AIQRunner:
 
-    def __init__(self, input_message: typing.Any, entry_fn: Function, context_state: AIQContextState):
+    def __init__(self,
+                 input_message: typing.Any,
+                 entry_fn: Function,
+                 context_state: AIQContextState,
+                 trace_sampling: TraceSamplingConfig | None = None,
+                 enable_tracing: bool = True,
+                 concurrency_limiter: AbstractAsyncContextManager | None = None):
         """
         The AIQRunner class is used to run a workflow. It handles converting input and output data types and running the
         workflow with the specified concurrency.
@@ -57,6 +69,14 @@ class AIQRunner:
             The entry function to the workflow
         context_state : AIQContextState
             The context state to use
+        trace_sampling : TraceSamplingConfig | None, optional
+            Tail-based sampling settings for the spans of this run. If `None`, every span is exported, by default None
+        enable_tracing : bool, optional
+            Whether to create spans for this run. Should be `False` when no telemetry exporters are configured, since
+            the spans would be discarded, by default True
+        concurrency_limiter : AbstractAsyncContextManager | None, optional
+            Shared limiter, such as an `asyncio.Semaphore`, which is held only while the workflow is executing. If
+            `None`, the concurrency is not limited, by default None
         """
 
         if (entry_fn is None):
@@ -66,6 +86,8 @@ class AIQRunner:
         self._context_state = context_state
         self._context = AIQContext(self._context_state)
 
+        self._concurrency_limiter = concurrency_limiter if concurrency_limiter is not None else nullcontext()
+
         self._state = AIQRunnerState.UNINITIALIZED
 
         self._input_message_token = None
@@ -73,13 +95,20 @@ class AIQRunner:
         # Before we start, we need to convert the input message to the workflow input type
         self._input_message = input_message
 
-        self._span_manager = AsyncOtelSpanListener(context_state=context_state)
+        self._span_manager = AsyncOtelSpanListener(context_state=context_state,
+                                                   enabled=enable_tracing,
+                                                   trace_sampling=trace_sampling)
 
     @property
     def context(self) -> AIQContext:
         return self._context
 
     def convert(self, value: typing.Any, to_type: type[_T]) -> _T:
+        # Skip the converter lookup when there is nothing to convert. An exact type check is used since `to_type` may be
+        # a generic alias which `isinstance` does not accept
+        if (to_type is None or type(value) is to_type):
+            return value
+
         return self._entry_fn.convert(value, to_type)
 
     async def __aenter__(self):
@@ -89,10 +118,7 @@ class AIQRunner:
 
         # Create reactive event stream
         self._context_state.event_stream.set(Subject())
-        self._context_state.active_function.set(InvocationNode(
-            function_name="root",
-            function_id="root",
-        ))
+        self._context_state.active_function.set(_ROOT_INVOCATION_NODE)
 
         if (self._state == AIQRunnerState.UNINITIALIZED):
             self._state = AIQRunnerState.INITIALIZED
@@ -130,22 +156,21 @@ class AIQRunner:
             if (not self._entry_fn.has_single_output):
                 raise ValueError("Workflow does not support single output")
 
-            async with self._span_manager.start():
+            async with self._concurrency_limiter, self._span_manager.start():
                 # Run the workflow
                 result = await self._entry_fn.ainvoke(self._input_message, to_type=to_type)
 
-                # Close the intermediate stream
-                self._context_state.event_stream.get().on_complete()
-
             self._state = AIQRunnerState.COMPLETED
 
             return result
         except Exception as e:
             logger.exception("Error running workflow: %s", e)
-            self._context_state.event_stream.get().on_complete()
             self._state = AIQRunnerState.FAILED
 
             raise
+        finally:
+            # Close the intermediate stream
+            self._context_state.event_stream.get().on_complete()
 
     async def result_stream(self, to_type: type | None = None):
 
@@ -159,18 +184,17 @@ class AIQRunner:
                 raise ValueError("Workflow does not support streaming output")
 
             # Run the workflow
-            async with self._span_manager.start():
+            async with self._concurrency_limiter, self._span_manager.start():
                 async for m in self._entry_fn.astream(self._input_message, to_type=to_type):
                     yield m
 
-                self._state = AIQRunnerState.COMPLETED
-
-                # Close the intermediate stream
-                self._context_state.event_stream.get().on_complete()
+            self._state = AIQRunnerState.COMPLETED
 
         except Exception as e:
             logger.exception("Error running workflow: %s", e)
-            self._context_state.event_stream.get().on_complete()
             self._state = AIQRunnerState.FAILED
 
             raise
+        finally:
+            # Close the intermediate stream. This also runs when the consumer stops iterating early
+            self._context_state.event_stream.get().on_complete()
@@ -15,6 +15,7 @@
 
 import asyncio
 import contextvars
+import logging
 import typing
 from collections.abc import Awaitable
 from collections.abc import Callable
@@ -28,16 +29,49 @@ from aiq.data_models.config import AIQConfig
 from aiq.data_models.interactive import HumanResponse
 from aiq.data_models.interactive import InteractionPrompt
 
+logger = logging.getLogger(__name__)
+
 _T = typing.TypeVar("_T")
 
+_MISSING = object()
+
 
 class UserManagerBase:
     pass
 
 
+class AIQOverloadedError(RuntimeError):
+    """
+    Raised when a workflow run is rejected because too many runs are already waiting for a concurrency slot.
+    """
+
+
+class _ConcurrencyLimiter:
+    """
+    Semaphore which also counts the number of callers waiting to acquire it.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.pending = 0
+
+    def locked(self) -> bool:
+        return self._semaphore.locked()
+
+    async def __aenter__(self):
+        self.pending += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.pending -= 1
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._semaphore.release()
+
+
 class AIQSessionManager:
 
-    def __init__(self, workflow: Workflow, max_concurrency: int = 8):
+    def __init__(self, workflow: Workflow, max_concurrency: int = 8, max_pending: int | None = None):
         """
         The AIQSessionManager class is used to run and manage a user workflow session. It runs and manages the context,
         and configuration of a workflow with the specified concurrency.
@@ -48,6 +82,10 @@ class AIQSessionManager:
             The workflow to run
         max_concurrency : int, optional
             The maximum number of simultaneous workflow invocations, by default 8
+        max_pending : int | None, optional
+            The maximum number of workflow invocations waiting for one of the `max_concurrency` slots. Once reached,
+            new runs are rejected with an `AIQOverloadedError` instead of waiting. If `None`, runs wait indefinitely,
+            by default None
         """
 
         if (workflow is None):
@@ -56,15 +94,18 @@ class AIQSessionManager:
         self._workflow: Workflow = workflow
 
         self._max_concurrency = max_concurrency
+        self._max_pending = max_pending
+        self._rejected_runs = 0
         self._context_state = AIQContextState.get()
         self._context = AIQContext(self._context_state)
 
         # We save the context because Uvicorn spawns a new process
         # for each request, and we need to restore the context vars
         self._saved_context = contextvars.copy_context()
+        self._saved_context_items = tuple(self._saved_context.items())
 
         if (max_concurrency > 0):
-            self._semaphore = asyncio.Semaphore(max_concurrency)
+            self._semaphore = _ConcurrencyLimiter(max_concurrency)
         else:
             # If max_concurrency is 0, then we don't need to limit the concurrency but we still need a context
             self._semaphore = nullcontext()
@@ -81,6 +122,13 @@ class AIQSessionManager:
     def context(self) -> AIQContext:
         return self._context
 
+    @property
+    def rejected_runs(self) -> int:
+        """
+        The number of runs rejected because `max_pending` runs were already waiting.
+        """
+        return self._rejected_runs
+
     @asynccontextmanager
     async def session(self,
                       user_manager=None,
@@ -102,15 +150,41 @@ class AIQSessionManager:
             if token_user_input is not None:
                 self._context_state.user_input_callback.reset(token_user_input)
 
+    def check_admission(self):
+        """
+        Check whether a new workflow run would be accepted. Front ends which can no longer report an error once they
+        start responding, such as streaming responses, should call this before responding.
+
+        Raises
+        ------
+        AIQOverloadedError
+            If `max_pending` runs are already waiting for a concurrency slot
+        """
+        if (self._max_pending is not None and isinstance(self._semaphore, _ConcurrencyLimiter)
+                and self._semaphore.locked() and self._semaphore.pending >= self._max_pending):
+            self._rejected_runs += 1
+            logger.warning("Rejecting workflow run, %d runs are already waiting to start", self._semaphore.pending)
+            raise AIQOverloadedError(f"Too many workflow runs are waiting to start (max_pending={self._max_pending})")
+
     @asynccontextmanager
     async def run(self, message):
         """
         Start a workflow run
+
+        Raises
+        ------
+        AIQOverloadedError
+            If `max_pending` runs are already waiting for a concurrency slot
         """
-        async with self._semaphore:
-            # Apply the saved context
-            for k, v in self._saved_context.items():
+        self.check_admission()
+
+        # Apply the saved context. Only set the vars which differ to avoid creating a new context mapping and reset
+        # token for every var on each run
+        for k, v in self._saved_context_items:
+            if (k.get(_MISSING) is not v):
                 k.set(v)
 
-            async with self._workflow.run(message) as runner:
-                yield runner
+        # The semaphore is held by the runner only while the workflow is executing, not for the whole time the caller
+        # holds the runner, so a slow consumer of the result does not take up a slot
+        async with self._workflow.run(message, concurrency_limiter=self._semaphore) as runner:
+            yield runner
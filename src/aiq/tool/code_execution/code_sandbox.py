@@ -13,16 +13,53 @@
 # limitations under the License.
 
 import abc
-import json
 import logging
 from urllib.parse import urljoin
 
-import requests
+import httpx
+import orjson
 from pydantic import HttpUrl
 
 logger = logging.getLogger(__file__)
 
 
+# Wraps the generated code so that its output and status are captured and printed as JSON by the sandbox
+_CODE_WRAPPER_TEMPLATE = """
+import traceback
+import json
+import os
+import warnings
+import contextlib
+import io
+warnings.filterwarnings('ignore')
+os.environ['OPENBLAS_NUM_THREADS'] = '16'
+
+\ngenerated_code = {generated_code!r}\n
+stdout = io.StringIO()
+stderr = io.StringIO()
+
+with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+    try:
+        exec(generated_code)
+        status = "completed"
+    except Exception:
+        status = "error"
+        stderr.write(traceback.format_exc())
+stdout = stdout.getvalue()
+stderr = stderr.getvalue()
+if len(stdout) > {max_output_characters}:
+    stdout = stdout[:{max_output_characters}] + "<output cut>"
+if len(stderr) > {max_output_characters}:
+    stderr = stderr[:{max_output_characters}] + "<output cut>"
+if stdout:
+    stdout += "\\n"
+if stderr:
+    stderr += "\\n"
+output = {{"process_status": status, "stdout": stdout, "stderr": stderr}}
+print(json.dumps(output))
+"""
+
+
 class Sandbox(abc.ABC):
     """Code execution sandbox.
 
@@ -44,22 +81,22 @@ class Sandbox(abc.ABC):
         uri: HttpUrl,
     ):
         self.url = self._get_execute_url(uri)
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        self.http_session = session
-
-    def _send_request(self, request, timeout):
-        output = self.http_session.post(
+        limits = httpx.Limits(max_connections=1500, max_keepalive_connections=1500)
+        self.http_client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(limits=limits, retries=3))
+
+    async def close(self):
+        await self.http_client.aclose()
+
+    async def _send_request(self, request, timeout):
+        output = await self.http_client.post(
             url=self.url,
-            data=json.dumps(request),
+            content=orjson.dumps(request),
             timeout=timeout,
             headers={"Content-Type": "application/json"},
         )
         # retrying 502 errors
         if output.status_code == 502:
-            raise requests.exceptions.Timeout
+            raise httpx.TimeoutException("Bad gateway")
 
         return self._parse_request_output(output)
 
@@ -83,47 +120,13 @@ class Sandbox(abc.ABC):
         max_output_characters: int = 1000,
     ) -> tuple[dict, str]:
 
-        generated_code = generated_code.lstrip().rstrip().lstrip("`").rstrip("`")
-        code_to_execute = """
-import traceback
-import json
-import os
-import warnings
-import contextlib
-import io
-warnings.filterwarnings('ignore')
-os.environ['OPENBLAS_NUM_THREADS'] = '16'
-"""
-
-        code_to_execute += f"""
-\ngenerated_code = {repr(generated_code)}\n
-stdout = io.StringIO()
-stderr = io.StringIO()
-
-with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
-    try:
-        exec(generated_code)
-        status = "completed"
-    except Exception:
-        status = "error"
-        stderr.write(traceback.format_exc())
-stdout = stdout.getvalue()
-stderr = stderr.getvalue()
-if len(stdout) > {max_output_characters}:
-    stdout = stdout[:{max_output_characters}] + "<output cut>"
-if len(stderr) > {max_output_characters}:
-    stderr = stderr[:{max_output_characters}] + "<output cut>"
-if stdout:
-    stdout += "\\n"
-if stderr:
-    stderr += "\\n"
-output = {{"process_status": status, "stdout": stdout, "stderr": stderr}}
-print(json.dumps(output))
-"""
+        generated_code = generated_code.strip().strip("`")
+        code_to_execute = _CODE_WRAPPER_TEMPLATE.format(generated_code=generated_code,
+                                                        max_output_characters=max_output_characters)
         request = self._prepare_request(code_to_execute, timeout)
         try:
-            output = self._send_request(request, timeout)
-        except requests.exceptions.Timeout:
+            output = await self._send_request(request, timeout)
+        except httpx.TimeoutException:
             output = {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
         return output
 
@@ -135,10 +138,12 @@ class LocalSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     def _parse_request_output(self, output):
+        raw = output.content
         try:
-            return output.json()
-        except json.JSONDecodeError as e:
-            logger.exception("Error  parsing output: %s. %s", output.text, e)
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            # Only log the start of the body, the sandbox output can be arbitrarily large
+            logger.exception("Error  parsing output: %r. %s", raw[:500], e)
             return {'process_status': 'error', 'stdout': '', 'stderr': 'Unknown error'}
 
     def _prepare_request(self, generated_code, timeout, language='python', **kwargs):
@@ -156,10 +161,10 @@ class PistonSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     def _parse_request_output(self, output):
-        output = output.json()
+        output = orjson.loads(output.content)
         if output['run']['signal'] == "SIGKILL":
             return {'result': None, 'error_message': 'Unknown error: SIGKILL'}
-        return json.loads(output['run']['output'])
+        return orjson.loads(output['run']['output'])
 
     def _prepare_request(self, generated_code: str, timeout, **kwargs):
         return {
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
 import multiprocessing
+import os
+import queue
 import resource
 import sys
+import threading
 from io import StringIO
 
 from flask import Flask
@@ -23,6 +27,19 @@ from flask import request
 
 app = Flask(__name__)
 
+# Code is executed in warm worker processes rather than a freshly started process per request. Each server process
+# (uWSGI worker) owns its own small set of workers, which is created lazily so that it is not shared across forks.
+_POOL_SIZE = int(os.environ.get("SANDBOX_POOL_SIZE", "1"))
+
+# Number of executions a worker runs before it is replaced. With the default of 1 every snippet runs in a fresh process,
+# as the replacement is started ahead of time this keeps the isolation between snippets without paying for the process
+# start on the request. Larger values skip starting a process per execution, but module state, monkeypatches and open
+# files left behind by one snippet are then visible to the next ones run by the same worker.
+_MAX_TASKS_PER_WORKER = max(1, int(os.environ.get("SANDBOX_MAX_TASKS_PER_WORKER", "1")))
+
+_idle_workers: queue.Queue["_SandboxWorker"] | None = None
+_idle_workers_lock = threading.Lock()
+
 
 @app.after_request
 def add_hsts_header(response):
@@ -30,35 +47,132 @@ def add_hsts_header(response):
     return response
 
 
+def _worker_main(connection):
+    _set_rlimits()
+
+    # Execute the snippets sent by the server until it closes its end of the pipe
+    while True:
+        try:
+            generated_code = connection.recv()
+        except EOFError:
+            return
+
+        connection.send(execute_code_subprocess(generated_code))
+
+
+class _SandboxWorker:
+    """
+    A single worker process, owned by the server process. Each execution is sent to the worker over a pipe, so that a
+    timed out or crashed execution only takes down the process it was running in, and not the executions running
+    concurrently in the other workers.
+    """
+
+    def __init__(self):
+        self.connection, worker_connection = multiprocessing.Pipe()
+
+        # Started now rather than on the next request. Not a daemon, so that the executed code can start processes
+        self.process = multiprocessing.Process(target=_worker_main, args=(worker_connection, ))
+        self.process.start()
+        worker_connection.close()
+
+        self.tasks = 0
+
+    def execute(self, generated_code, timeout):
+        """
+        Runs the code in the worker. Raises `TimeoutError` if it does not finish in time and `EOFError` or `OSError`
+        if the worker process has died.
+        """
+        self.connection.send(generated_code)
+
+        if (not self.connection.poll(timeout)):
+            raise TimeoutError()
+
+        return self.connection.recv()
+
+    def kill(self):
+        # A timed out execution may still be running, so the process has to be killed rather than asked to stop
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _get_idle_workers() -> queue.Queue[_SandboxWorker]:
+    global _idle_workers  # pylint: disable=global-statement
+
+    with _idle_workers_lock:
+        if _idle_workers is None:
+            _idle_workers = queue.Queue()
+            for _ in range(_POOL_SIZE):
+                _idle_workers.put(_SandboxWorker())
+
+            # Registered after starting the workers, which registers the exit handler of `multiprocessing` that waits
+            # for them. Exit handlers run in reverse order, so the workers are killed before that handler waits
+            atexit.register(_kill_idle_workers)
+
+        return _idle_workers
+
+
+def _kill_idle_workers():
+    # The workers are not daemons, so they have to be stopped for the server process to exit
+    if _idle_workers is None:
+        return
+
+    while True:
+        try:
+            _idle_workers.get_nowait().kill()
+        except queue.Empty:
+            return
+
+
 def execute_python(generated_code, timeout):
     # running in a separate process to ensure any kind of crashes are properly handled
-    queue = multiprocessing.Queue()
-    process = multiprocessing.Process(target=execute_code_subprocess, args=(generated_code, queue))
-    process.start()
-    process.join(timeout=timeout)
+    idle_workers = _get_idle_workers()
+    worker = idle_workers.get()
+    replace_worker = True
 
-    if process.is_alive():  # didn't finish successfully
-        process.kill()
+    # Do not send the code to a worker which failed to start or has died while idle
+    if (not worker.process.is_alive()):
+        worker.kill()
+        worker = _SandboxWorker()
+
+    try:
+        result = worker.execute(generated_code, timeout)
+        worker.tasks += 1
+        replace_worker = worker.tasks >= _MAX_TASKS_PER_WORKER
+        return result
+    except TimeoutError:  # didn't finish successfully
         return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+    except (EOFError, OSError):
+        return {"process_status": "error", "stdout": "", "stderr": "Sandbox process crashed\n"}
+    finally:
+        # Replace the worker straight away so its process is already running when the next request arrives
+        if (replace_worker):
+            worker.kill()
+            worker = _SandboxWorker()
 
-    return queue.get()
+        idle_workers.put(worker)
 
 
 # need to memory-limit to avoid common errors of allocating too much
 # but this has to be done in a subprocess to not crush server itself
-def execute_code_subprocess(generated_code, queue):
+def _set_rlimits():
     limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
     resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
     resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
 
+
+def execute_code_subprocess(generated_code):
     # this can be overriden inside generated code, so it's not a guaranteed protection
     sys.stdout = StringIO()
     try:
         exec(generated_code, {})  # pylint: disable=W0122
-        queue.put(sys.stdout.getvalue())
-    except Exception as e:
+        return sys.stdout.getvalue()
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+        # Includes `SystemExit` from `sys.exit()` in the executed code, which must not end the worker
         print(f"Error: {str(e)}")
-        queue.put({"process_status": "error", "stdout": "", "stderr": str(e) + "\n"})
+        return {"process_status": "error", "stdout": "", "stderr": str(e) + "\n"}
+    finally:
+        sys.stdout = sys.__stdout__
 
 
 # Main Flask endpoint to handle execution requests
@@ -74,6 +188,16 @@ def execute():
 
 
 if __name__ == '__main__':
-    log = logging.getLogger('werkzeug')
-    log.setLevel(logging.WARNING)
-    app.run(port=6000)
+    # The sandbox image serves the app through nginx and uWSGI. When run directly, serve it with waitress, a production
+    # WSGI server which handles requests on threads in a single process, rather than Flask's development server
+    from waitress import serve
+
+    # There is a single server process, so give it one worker per CPU for requests to execute in parallel
+    _POOL_SIZE = int(os.environ.get("SANDBOX_POOL_SIZE", str(os.cpu_count() or 1)))
+
+    # There is no forking after this point, so the workers can be started before the first request
+    _get_idle_workers()
+
+    logging.getLogger("waitress").setLevel(logging.WARNING)
+
+    serve(app, host="127.0.0.1", port=6000, threads=_POOL_SIZE)
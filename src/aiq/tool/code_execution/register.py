@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+from contextlib import nullcontext
 from typing import Literal
 
 from pydantic import BaseModel
@@ -37,6 +39,10 @@ class CodeExecutionToolConfig(FunctionBaseConfig, name="code_execution"):
     sandbox_type: Literal["local", "piston"] = Field(default="local", description="The type of code execution sandbox")
     timeout: float = Field(default=10.0, description="Number of seconds to wait for a code execution request")
     max_output_characters: int = Field(default=1000, description="Maximum number of characters that can be returned")
+    max_concurrency: int | None = Field(default=None,
+                                        ge=1,
+                                        description="Maximum number of code executions running at once. Defaults to "
+                                        "no limit.")
 
 
 @register_function(config_type=CodeExecutionToolConfig)
@@ -48,23 +54,31 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
 
     sandbox = get_sandbox(sandbox_type=config.sandbox_type, uri=config.uri)
 
+    # Code execution is compute bound on the sandbox, unlike most tools which wait on I/O. When configured, limit it
+    # separately from the workflow concurrency so that many concurrent workflows do not overload the sandbox.
+    semaphore = asyncio.Semaphore(config.max_concurrency) if config.max_concurrency is not None else nullcontext()
+
     async def _execute_code(generated_code: str) -> dict:
         logger.info("Executing code in the sandbox at %s", config.uri)
         try:
-            output = await sandbox.execute_code(
-                generated_code=generated_code,
-                language="python",
-                timeout=config.timeout,
-                max_output_characters=config.max_output_characters,
-            )
+            async with semaphore:
+                output = await sandbox.execute_code(
+                    generated_code=generated_code,
+                    language="python",
+                    timeout=config.timeout,
+                    max_output_characters=config.max_output_characters,
+                )
         except Exception as e:
             logger.exception("Error when executing code in the sandbox, %s", e)
             return {"process_status": "error", "stdout": "", "stderr": e}
         return output
 
-    yield FunctionInfo.from_fn(
-        fn=_execute_code,
-        input_schema=CodeExecutionInputSchema,
-        description="""Executes the provied 'generated_code' in a python sandbox environment and returns
+    try:
+        yield FunctionInfo.from_fn(
+            fn=_execute_code,
+            input_schema=CodeExecutionInputSchema,
+            description="""Executes the provied 'generated_code' in a python sandbox environment and returns
         a dictionary containing stdout, stderr, and the execution status, as well as a session_id. The
         session_id can be used to append to code that was previously executed.""")
+    finally:
+        await sandbox.close()
@@ -58,18 +58,24 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):
 
     logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
 
-    def _convert_from_str(input_str: str) -> tool.input_schema:
-        return tool.input_schema.model_validate_json(input_str)
+    # The input schema is fixed once the tool is loaded, so resolve its compiled validator once instead of on every call
+    input_schema = tool.input_schema
+    validate_json = input_schema.__pydantic_validator__.validate_json
+    validate_python = input_schema.__pydantic_validator__.validate_python
+    tool_acall = tool.acall
+
+    def _convert_from_str(input_str: str) -> input_schema:
+        return validate_json(input_str)
 
     async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
         if tool_input:
             args = tool_input.model_dump()
-            return await tool.acall(args)
+            return await tool_acall(args)
 
-        _ = tool.input_schema.model_validate(kwargs)
-        return await tool.acall(kwargs)
+        _ = validate_python(kwargs)
+        return await tool_acall(kwargs)
 
     yield FunctionInfo.create(single_fn=_response_fn,
                               description=tool.description,
-                              input_schema=tool.input_schema,
+                              input_schema=input_schema,
                               converters=[_convert_from_str])
@@ -13,38 +13,42 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import io
 import typing
 
 import yaml
 
 from aiq.utils.type_utils import StrPath
 
+# Prefer the libyaml backed loader and dumper, which are much faster than the pure Python implementations
+try:
+    from yaml import CDumper as _Dumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import Dumper as _Dumper
+    from yaml import SafeLoader as _SafeLoader
+
 
 def yaml_load(config_path: StrPath) -> dict:
 
     # Read YAML file
     with open(config_path, 'r', encoding="utf-8") as stream:
-        config_data = yaml.safe_load(stream)
+        config_data = yaml.load(stream, Loader=_SafeLoader)
 
     return config_data
 
 
 def yaml_loads(config: str) -> dict:
 
-    stream = io.StringIO(config)
-    stream.seek(0)
-
-    return yaml.safe_load(stream)
+    return yaml.load(config, Loader=_SafeLoader)
 
 
 def yaml_dump(config: dict, fp: typing.TextIO) -> None:
 
-    yaml.dump(config, stream=fp, indent=2, sort_keys=False)
+    yaml.dump(config, stream=fp, Dumper=_Dumper, indent=2, sort_keys=False)
 
     fp.flush()
 
 
 def yaml_dumps(config: dict) -> str:
 
-    return yaml.dump(config, indent=2)
+    return yaml.dump(config, Dumper=_Dumper, indent=2)
@@ -15,6 +15,7 @@
 
 import asyncio
 import typing
+from collections import deque
 
 _T = typing.TypeVar("_T")
 
@@ -176,3 +177,69 @@ class AsyncIOProducerConsumerQueue(asyncio.Queue, typing.Generic[_T]):
     def is_closed(self) -> bool:
         """Check if the queue is closed."""
         return self._is_closed
+
+
+class SingleConsumerQueue(typing.Generic[_T]):
+    """
+    Unbounded, closable queue for a single consumer task, backed by a deque and a wake-up future. Much cheaper per
+    operation than `asyncio.Queue`, which supports multiple consumers and bounded sizes. Items can be put from
+    synchronous callbacks running on the event loop thread.
+    """
+
+    def __init__(self) -> None:
+        self._deque: deque[_T] = deque()
+        self._waker: asyncio.Future[None] | None = None
+        self._is_closed = False
+
+    async def __aiter__(self):
+        try:
+            while True:
+                yield await self.get()
+        except QueueClosed:
+            return
+
+    def _wakeup(self) -> None:
+        if (self._waker is not None and not self._waker.done()):
+            self._waker.set_result(None)
+
+    def put(self, item: _T) -> None:
+        """Put an item into the queue. Raises QueueClosed if the queue is closed."""
+        if (self._is_closed):
+            raise QueueClosed  # @IgnoreException
+
+        self._deque.append(item)
+        self._wakeup()
+
+    async def get(self) -> _T:
+        """
+        Remove and return an item from the queue, waiting until one is available. Raises QueueClosed once the queue
+        is closed and empty.
+        """
+        while (not self._deque and not self._is_closed):
+            self._waker = asyncio.get_running_loop().create_future()
+            try:
+                await self._waker
+            finally:
+                self._waker = None
+
+        if (not self._deque):
+            raise QueueClosed  # @IgnoreException
+
+        return self._deque.popleft()
+
+    def drain(self, max_items: int) -> list[_T]:
+        """Remove and return up to `max_items` items which are already in the queue without waiting."""
+        items: list[_T] = []
+        while (self._deque and len(items) < max_items):
+            items.append(self._deque.popleft())
+
+        return items
+
+    def close(self) -> None:
+        """Close the queue. Items already in the queue can still be read."""
+        self._is_closed = True
+        self._wakeup()
+
+    def is_closed(self) -> bool:
+        """Check if the queue is closed."""
+        return self._is_closed
@@ -15,6 +15,7 @@
 
 import pytest
 from langchain_core.agents import AgentAction
+from langchain_core.agents import AgentFinish
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages.tool import ToolMessage
@@ -412,3 +413,11 @@ async def test_output_parser_missing_action_input(mock_react_output_parser):
         await mock_react_output_parser.aparse(mock_input)
     assert isinstance(ex.value, ReActOutputParserException)
     assert ex.value.observation == MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE
+
+
+async def test_output_parser_final_answer(mock_react_output_parser):
+    mock_input = 'Thought: I now know the final answer\nFinal Answer: lorem ipsum'
+    test_output = await mock_react_output_parser.aparse(mock_input)
+    assert isinstance(test_output, AgentFinish)
+    assert test_output.return_values == {"output": "lorem ipsum"}
+    assert test_output.log == mock_input
@@ -280,6 +280,15 @@ async def test_run_workflow_remote(evaluation_run, session_manager):
         await evaluation_run.run_workflow(session_manager)
 
 
+def test_jsonpath_expr_cached():
+    """Test that jsonpath expressions are parsed once and reused across evaluation runs."""
+    from aiq.eval.evaluate import _get_jsonpath_expr
+
+    first = _get_jsonpath_expr("$.output")
+    assert _get_jsonpath_expr("$.output") is first, "Expected the cached jsonpath expression to be reused"
+    assert _get_jsonpath_expr("$") is not first, "Expected different paths to be parsed separately"
+
+
 # Batch-2: Tests for running evaluators
 async def test_run_single_evaluator_success(evaluation_run, mock_evaluator, eval_output, average_score):
     """Test for running a single evaluator."""
@@ -357,7 +366,7 @@ async def test_run_evaluators_partial_failure(evaluation_run, mock_evaluator, ev
 
 
 # Batch-3: Tests for running eval and writing results
-def test_write_output(evaluation_run, default_eval_config, eval_input, eval_output, generated_answer):
+async def test_write_output(evaluation_run, default_eval_config, eval_input, eval_output, generated_answer):
     """Test writing the workflow and evaluation results."""
     # Mock dataset handler to get the formatted workflow results
     for eval_input_item in eval_input.eval_input_items:
@@ -387,7 +396,7 @@ def test_write_output(evaluation_run, default_eval_config, eval_input, eval_outp
          patch("aiq.eval.evaluate.logger.info") as mock_logger:
 
         # Run the actual function
-        evaluation_run.write_output(mock_dataset_handler)
+        await evaluation_run.write_output(mock_dataset_handler)
 
         # Ensure directories are created
         mock_mkdir.assert_called()
@@ -451,7 +460,7 @@ async def test_run_and_evaluate(evaluation_run, default_eval_config, session_man
          patch.object(evaluation_run, "run_workflow", wraps=evaluation_run.run_workflow) as mock_run_workflow, \
          patch.object(evaluation_run, "run_evaluators", AsyncMock()) as mock_run_evaluators, \
          patch.object(evaluation_run, "profile_workflow", AsyncMock()) as mock_profile_workflow, \
-         patch.object(evaluation_run, "write_output", MagicMock()) as mock_write_output:
+         patch.object(evaluation_run, "write_output", AsyncMock()) as mock_write_output:
 
         # Run the function
         await evaluation_run.run_and_evaluate()
@@ -476,7 +485,7 @@ async def test_run_and_evaluate(evaluation_run, default_eval_config, session_man
         mock_profile_workflow.assert_called_once()
 
         # Ensure output is written
-        mock_write_output.assert_called_once_with(mock_dataset_handler)
+        mock_write_output.assert_awaited_once_with(mock_dataset_handler)
 
         # Ensure custom scripts are run and directory is uploaded
         mock_uploader.run_custom_scripts.assert_called_once()
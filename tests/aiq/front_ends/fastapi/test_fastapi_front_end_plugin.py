@@ -31,6 +31,7 @@ from aiq.data_models.api_server import Message
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.config import GeneralConfig
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+from aiq.front_ends.fastapi.fastapi_front_end_plugin import FastApiFrontEndPlugin
 from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
 from aiq.test.functions import EchoFunctionConfig
 from aiq.test.functions import StreamingEchoFunctionConfig
@@ -202,3 +203,25 @@ async def test_specified_endpoints():
 
         assert response.status_code == 200
         assert response.json() == {"value": "Hello"}
+
+
+@pytest.mark.parametrize("workers, web_concurrency, expected", [(3, "5", 3), (1, "5", 1), (0, "5", 5), (0, None, 4)])
+def test_get_workers(monkeypatch: pytest.MonkeyPatch, workers: int, web_concurrency: str | None, expected: int):
+
+    if (web_concurrency is None):
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("WEB_CONCURRENCY", web_concurrency)
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+    config = AIQConfig(
+        general=GeneralConfig(front_end=FastApiFrontEndConfig(workers=workers)),
+        workflow=EchoFunctionConfig(),
+    )
+
+    assert FastApiFrontEndPlugin(full_config=config).get_workers() == expected
+
+
+def test_default_workers():
+    assert FastApiFrontEndConfig().workers == 1
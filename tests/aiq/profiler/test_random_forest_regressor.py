@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(name="model")
+def model_fixture():
+    pytest.importorskip("sklearn")
+
+    from aiq.profiler.forecasting.models.random_forest_regressor import RandomForestModel
+
+    return RandomForestModel()
+
+
+def test_preprocess_windows(model):
+    arr = np.arange(12, dtype=float).reshape(4, 3)
+
+    x_windows, y_windows = model._preprocess_for_forecasting([arr], n=2, k=2)
+
+    assert x_windows.shape == (4, 2, 3)
+    assert y_windows.shape == (4, 2, 3)
+
+    # The window for row 0 is padded with zeros and the current output tokens are hidden
+    np.testing.assert_array_equal(x_windows[0], [[0, 0, 0], [0, 1, 0]])
+    np.testing.assert_array_equal(x_windows[2], [[3, 4, 5], [6, 7, 0]])
+
+    # The label for the last row is entirely padding
+    np.testing.assert_array_equal(y_windows[1], [[6, 7, 8], [9, 10, 11]])
+    np.testing.assert_array_equal(y_windows[3], np.zeros((2, 3)))
+
+
+def test_preprocess_skips_short_runs(model):
+    arr = np.arange(12, dtype=float).reshape(4, 3)
+
+    # A run without any LLM_END steps produces an empty array, and a run with a single call is shorter than n
+    x_windows, y_windows = model._preprocess_for_forecasting([np.array([]), arr, arr[:1]], n=2, k=2)
+
+    assert x_windows.shape == (4, 2, 3)
+    assert y_windows.shape == (4, 2, 3)
+
+    x_windows, y_windows = model._preprocess_for_forecasting([np.array([])], n=2, k=2)
+
+    assert x_windows.shape == (0, 2, 3)
+    assert y_windows.shape == (0, 2, 3)
@@ -84,3 +84,21 @@ def test_subject_late_subscriber_after_dispose():
     sub.subscribe(Observer(on_next=items.append))
     sub.on_next("ignored")
     assert not items
+
+
+def test_subject_unsubscribe_during_on_next():
+    sub = Subject[str]()
+    items1, items2 = [], []
+
+    def on_next1(value: str):
+        items1.append(value)
+        sub1.unsubscribe()
+
+    sub1 = sub.subscribe(Observer(on_next=on_next1))
+    sub.subscribe(Observer(on_next=items2.append))
+
+    # The observer unsubscribing itself does not affect delivery of the current item to the others
+    sub.on_next("X")
+    sub.on_next("Y")
+    assert items1 == ["X"]
+    assert items2 == ["X", "Y"]
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+
+from aiq.runtime.loader import load_config
+from aiq.test.functions import EchoFunctionConfig
+
+
+def test_load_config_cache(tmp_path):
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("workflow:\n  _type: test_echo\n", encoding="utf-8")
+
+    config = load_config(config_file)
+    assert isinstance(config.workflow, EchoFunctionConfig)
+    assert not config.workflow.use_openai_api
+
+    # Each call returns its own copy of the cached config
+    config.workflow.use_openai_api = True
+    assert not load_config(config_file).workflow.use_openai_api
+
+    # Modifying the file invalidates the cached entry
+    config_file.write_text("workflow:\n  _type: test_echo\n  use_openai_api: true\n", encoding="utf-8")
+    stat_result = os.stat(config_file)
+    os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    assert load_config(config_file).workflow.use_openai_api
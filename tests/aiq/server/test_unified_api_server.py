@@ -463,6 +463,22 @@ async def test_resolve_system_interaction_message_type_by_input_data(data_model:
     assert message_type == WebSocketMessageType.SYSTEM_INTERACTION_MESSAGE
 
 
+async def test_resolve_message_type_by_input_data_cached():
+    """Resolved message types are cached by data model type, unresolved types are not."""
+    message_validator = MessageValidator()
+
+    for _ in range(2):
+        message_type = await message_validator.resolve_message_type_by_data(aiq_response_intermediate_step_test)
+        assert message_type == WebSocketMessageType.INTERMEDIATE_STEP_MESSAGE
+
+    message_type = await message_validator.resolve_message_type_by_data(TEST())
+    assert message_type == WebSocketMessageType.ERROR_MESSAGE
+
+    assert message_validator._resolved_message_types == {
+        AIQResponseIntermediateStep: WebSocketMessageType.INTERMEDIATE_STEP_MESSAGE
+    }
+
+
 async def test_resolve_error_message_type_by_invalid_input_data():
     """Resolve validated message type WebSocketMessageType.ERROR_MESSAGE from
     invalid input data."""
@@ -18,8 +18,8 @@ import logging
 from io import StringIO
 from urllib.parse import urljoin
 
+import httpx
 import pytest
-import requests
 from pytest_httpserver import HTTPServer
 from werkzeug import Request
 from werkzeug import Response
@@ -75,7 +75,7 @@ async def test_bad_response(httpserver: HTTPServer):
     client = code_sandbox.get_sandbox("local", uri="http://localhost:9999")
 
     # Test that connection error is raised when the service is unavailable
-    with pytest.raises(requests.exceptions.ConnectionError):
+    with pytest.raises(httpx.ConnectError):
         _ = await client.execute_code(generated_code='print("Hello World")')
 
     # Test for JSON parsing error
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from aiq.utils.producer_consumer_queue import QueueClosed
+from aiq.utils.producer_consumer_queue import SingleConsumerQueue
+
+
+async def test_single_consumer_queue_get_waits_for_put():
+    q: SingleConsumerQueue[int] = SingleConsumerQueue()
+
+    get_task = asyncio.create_task(q.get())
+    await asyncio.sleep(0)
+    assert not get_task.done()
+
+    q.put(1)
+    assert await get_task == 1
+
+
+async def test_single_consumer_queue_drain():
+    q: SingleConsumerQueue[int] = SingleConsumerQueue()
+
+    for i in range(5):
+        q.put(i)
+
+    assert q.drain(3) == [0, 1, 2]
+    assert q.drain(3) == [3, 4]
+    assert q.drain(3) == []
+
+
+async def test_single_consumer_queue_close():
+    q: SingleConsumerQueue[int] = SingleConsumerQueue()
+
+    async def consume() -> list[int]:
+        return [item async for item in q]
+
+    consume_task = asyncio.create_task(consume())
+
+    q.put(1)
+    q.put(2)
+    q.close()
+
+    # Items put before closing are still delivered
+    assert await consume_task == [1, 2]
+    assert q.is_closed()
+
+    with pytest.raises(QueueClosed):
+        q.put(3)
+
+    with pytest.raises(QueueClosed):
+        await q.get()